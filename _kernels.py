@@ -0,0 +1,158 @@
+"""
+Numeric hot-path kernels for the vector ephemeris engine.
+
+Every kernel has two implementations selected at import time: a Numba
+@njit(parallel=True) version when numba is installed (the 'fast' extra),
+and a plain NumPy fallback with identical semantics otherwise. Callers
+import the names from here and stay oblivious to which one they got.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def synth_ketu(out: np.ndarray, rahu_col: int, ketu_col: int, invert_lat: bool) -> None:
+        # In-place on the final (T, B, 6) array. The Ketu column may alias
+        # the Rahu column (it is pre-seeded with Rahu's rows), so longitude
+        # is read before being overwritten.
+        for j in prange(out.shape[0]):
+            lon = out[j, rahu_col, 0] + 180.0
+            if lon >= 360.0:
+                lon -= 360.0
+            out[j, ketu_col, 0] = lon
+            lat = out[j, rahu_col, 1]
+            out[j, ketu_col, 1] = -lat if invert_lat else lat
+            for c in range(2, out.shape[2]):
+                out[j, ketu_col, c] = out[j, rahu_col, c]
+
+    @njit(cache=True, fastmath=True)
+    def nakshatra_index_pada(lon: float):
+        # Scalar core of the nakshatra lookup: (index 0-26, pada 1-4).
+        # The name lookup stays outside the jit.
+        raw = (lon % 360.0) / (360.0 / 27.0)
+        idx = int(raw)
+        return idx, int((raw - idx) * 4.0) + 1
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def aspect_masks(lon: np.ndarray, targets: np.ndarray, orb: float) -> np.ndarray:
+        # (T, B) longitudes + (K,) aspect angles -> (K, T, B, B) bool masks.
+        # The masks are symmetric with a False diagonal by construction, so
+        # only the upper triangle is computed; each hit is mirrored.
+        T, B = lon.shape
+        K = targets.shape[0]
+        out = np.zeros((K, T, B, B), dtype=np.bool_)
+        for t in prange(T):
+            for i in range(B):
+                li = lon[t, i]
+                for j in range(i + 1, B):
+                    d = abs(li - lon[t, j]) % 360.0
+                    if d > 180.0:
+                        d = 360.0 - d
+                    for k in range(K):
+                        if abs(d - targets[k]) <= orb:
+                            out[k, t, i, j] = True
+                            out[k, t, j, i] = True
+        return out
+
+    @njit(fastmath=True, cache=True)
+    def drik_bala_totals(
+        lon: np.ndarray,
+        targets: np.ndarray,
+        orb: float,
+        benefic: np.ndarray,
+        malefic: np.ndarray,
+    ) -> np.ndarray:
+        # (B,) longitudes -> (B,) signed aspect-strength sums for Drik
+        # Bala: each in-orb aspect contributes 60*(1 - |delta|/orb), added
+        # when the partner is benefic and subtracted when malefic. Only
+        # the upper triangle is walked; each pair credits both planets.
+        B = lon.shape[0]
+        K = targets.shape[0]
+        out = np.zeros(B, dtype=np.float64)
+        for i in range(B):
+            for j in range(i + 1, B):
+                d = abs(lon[i] - lon[j]) % 360.0
+                if d > 180.0:
+                    d = 360.0 - d
+                for k in range(K):
+                    dd = abs(d - targets[k])
+                    if dd <= orb:
+                        s = 60.0 * (1.0 - dd / orb)
+                        if benefic[j]:
+                            out[i] += s
+                        elif malefic[j]:
+                            out[i] -= s
+                        if benefic[i]:
+                            out[j] += s
+                        elif malefic[i]:
+                            out[j] -= s
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def pairwise_abs_angle_diff(lon: np.ndarray) -> np.ndarray:
+        # (T, B) longitudes -> (T, B, B) smallest absolute angular distance,
+        # fused modulo + fold without materializing NumPy temporaries.
+        T, B = lon.shape
+        out = np.empty((T, B, B), dtype=lon.dtype)
+        for t in prange(T):
+            for i in range(B):
+                li = lon[t, i]
+                for j in range(B):
+                    d = abs(li - lon[t, j]) % 360.0
+                    if d > 180.0:
+                        d = 360.0 - d
+                    out[t, i, j] = d
+        return out
+
+else:
+
+    def synth_ketu(out: np.ndarray, rahu_col: int, ketu_col: int, invert_lat: bool) -> None:
+        # rahu + 180 lies in [180, 540): at most one wrap, so a masked
+        # subtract replaces the generic fmod of `% 360.0`. The addition
+        # also copies, keeping the write safe when ketu_col aliases
+        # rahu_col.
+        lon = out[:, rahu_col, 0] + 180.0
+        np.subtract(lon, 360.0, out=lon, where=lon >= 360.0)
+        out[:, ketu_col, 0] = lon
+        lat = out[:, rahu_col, 1]
+        out[:, ketu_col, 1] = -lat if invert_lat else lat
+        out[:, ketu_col, 2:] = out[:, rahu_col, 2:]
+
+    def pairwise_abs_angle_diff(lon: np.ndarray) -> np.ndarray:
+        diff = lon[..., None] - lon[:, None, :]
+        diff = (diff + 180.0) % 360.0 - 180.0
+        return np.abs(diff)
+
+    def nakshatra_index_pada(lon: float):
+        raw = (lon % 360.0) / (360.0 / 27.0)
+        idx = int(raw)
+        return idx, int((raw - idx) * 4.0) + 1
+
+    def aspect_masks(lon: np.ndarray, targets: np.ndarray, orb: float) -> np.ndarray:
+        d = pairwise_abs_angle_diff(lon)
+        out = np.abs(d[None, ...] - targets[:, None, None, None]) <= orb
+        idx = np.arange(lon.shape[1])
+        out[:, :, idx, idx] = False
+        return out
+
+    def drik_bala_totals(
+        lon: np.ndarray,
+        targets: np.ndarray,
+        orb: float,
+        benefic: np.ndarray,
+        malefic: np.ndarray,
+    ) -> np.ndarray:
+        d = pairwise_abs_angle_diff(lon[None, :])[0]
+        dd = np.abs(d[None, ...] - targets[:, None, None])
+        strength = np.where(dd <= orb, 60.0 * (1.0 - dd / orb), 0.0).sum(axis=0)
+        idx = np.arange(lon.shape[0])
+        strength[idx, idx] = 0.0
+        return strength @ (benefic.astype(np.float64) - malefic.astype(np.float64))
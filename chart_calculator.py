@@ -1,5 +1,12 @@
 import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional serializer ('fast' extra)
+    orjson = None
+
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import pytz
 
@@ -11,6 +18,22 @@ from logic.varga_engine import calculate_all_vargas
 from logic import maitri, strengths, shadbala
 
 
+@lru_cache(maxsize=None)
+def get_default_calculator(
+    *, sidereal: bool = False, ayanamsa: str = "LAHIRI"
+) -> "ChartCalculator":
+    """
+    Shared ChartCalculator per (sidereal, ayanamsa) configuration.
+
+    Constructing a calculator initializes the ephemeris provider (and with
+    it the multi-MB Swiss Ephemeris tables); callers running many charts —
+    the run_*.py scripts, a web service — should go through here so that
+    cost is paid once per configuration, not per chart. Construction is
+    lazy: importing this module loads nothing.
+    """
+    return ChartCalculator(sidereal=sidereal, ayanamsa=ayanamsa)
+
+
 class ChartCalculator:
     def __init__(self, *, sidereal: bool = False, ayanamsa: str = "LAHIRI"):
         # Scalar provider with houses (Placidus by default)
@@ -34,6 +57,15 @@ class ChartCalculator:
         name: str = "Unknown",
     ) -> str:
         data = self.calculate_dict(dt_utc, lat, lon, name)
+        if orjson is not None:
+            # C-level serialization of the float-heavy payload; datetimes
+            # and NumPy scalars are handled natively, _json_default covers
+            # the rest.
+            return orjson.dumps(
+                data,
+                default=self._json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
         return json.dumps(data, default=self._json_default, indent=2)
 
     def calculate_dict(
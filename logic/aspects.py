@@ -3,6 +3,7 @@ import numpy as np
 
 from raavi_ephemeris import SkyFrame, SkyPosition  # type: ignore
 from raavi_ephemeris_vector import EphemerisBatch  # type: ignore
+from _kernels import aspect_masks
 
 # Aspect name -> exact angle in degrees
 DEFAULT_ASPECTS: Dict[str, float] = {
@@ -90,35 +91,17 @@ def compute_aspects_for_batch(
     bnames = bodies or batch.bodies
 
     # Map requested bodies to indices in the batch
-    body_indices = [batch.bodies.index(name) for name in bnames]
-    N_time = batch.jds.shape[0]
-    N_body = len(body_indices)
-
-    # Extract longitudes: (T, B)
-    # raw_results shape: (T, full_B, 6) -> we take index 0 = lon
-    lon_full = batch.raw_results[:, :, 0]
-    lon = lon_full[:, body_indices]  # (T, B)
+    body_indices = [batch.index_of(name) for name in bnames]
+
+    # Extract longitudes from the contiguous (T, B) SoA view
+    lon = batch.lon[:, body_indices]  # (T, B)
     lon = np.mod(lon, 360.0)
 
-    # Compute pairwise angle differences using broadcasting
-    # lon[..., None] shape: (T, B, 1)
-    # lon[:, None, :] shape: (T, 1, B)
-    diff = (lon[..., None] - lon[:, None, :])  # (T, B, B)
-    # Normalize to [-180, 180]
-    diff = (diff + 180.0) % 360.0 - 180.0
-    abs_diff = np.abs(diff)
-
-    masks: Dict[str, np.ndarray] = {}
-    for asp_name, asp_angle in aspects_def.items():
-        target = asp_angle
-        # For conjunction (0 deg), just check abs(angle) <= orb
-        if target == 0.0:
-            mask = abs_diff <= orb
-        else:
-            mask = np.abs(abs_diff - target) <= orb
-        # Zero out diagonal (self-self)
-        mask = mask & ~np.eye(N_body, dtype=bool)[None, :, :]
-        masks[asp_name] = mask
-
-    return masks
+    # All aspect masks in one kernel pass over the upper triangle; jitted
+    # when numba is available, broadcasting fallback otherwise. Masks come
+    # back symmetric with a False diagonal.
+    targets = np.array(list(aspects_def.values()), dtype=np.float64)
+    mask_stack = aspect_masks(np.ascontiguousarray(lon), targets, float(orb))
+
+    return {name: mask_stack[k] for k, name in enumerate(aspects_def)}
 
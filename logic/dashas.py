@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Tuple
 
-from logic.nakshatras import get_nakshatra_scalar, NAKSHATRA_EXTENT
+import numpy as np
+
+from logic.nakshatras import NAKSHATRA_EXTENT
 
 # Vimshottari Constants
 # Sequence of lords starting from Ashwini (Ketu)
@@ -23,6 +25,14 @@ DASHA_YEARS = {
     "Mercury": 17,
 }
 
+# Same durations in DASHA_LORDS order, for vectorized sequencing
+DASHA_YEARS_SEQ = np.array([DASHA_YEARS[lord] for lord in DASHA_LORDS], dtype=np.float64)
+
+DAYS_PER_YEAR = 365.25
+
+# Nakshatra boundaries 0..360 for the searchsorted lookup below.
+_NAK_BREAKS = np.arange(28) * NAKSHATRA_EXTENT
+
 
 @dataclass
 class DashaPeriod:
@@ -44,64 +54,48 @@ def calculate_vimshottari(moon_longitude: float, birth_date: datetime, total_yea
     Returns:
         List of DashaPeriod objects covering the requested timeframe.
     """
-    # 1. Get Nakshatra info
-    # We need the exact position to calculate how much of the nakshatra is traversed.
-    nak_idx, _, _ = get_nakshatra_scalar(moon_longitude)
+    # 1. Locate the Nakshatra against the boundary table. searchsorted on
+    # the normalized longitude gives both the index and, via the matching
+    # boundary, a traversed arc that is always in [0, extent) — so the
+    # balance fraction below cannot go negative at the Revati wrap.
+    lon_mod = moon_longitude % 360.0
+    nak_idx = int(np.searchsorted(_NAK_BREAKS, lon_mod, side="right")) - 1
 
     # 2. Determine the Ruling Planet (Lord)
     # The cycle of 9 lords repeats. Ashwini(0) -> Ketu(0), Bharani(1) -> Venus(1)...
     lord_idx = nak_idx % 9
-    current_lord = DASHA_LORDS[lord_idx]
 
     # 3. Calculate Balance of Dasha (Sesh Dasha)
-    # How far into the nakshatra is the Moon?
-    # Start of current nakshatra:
-    nak_start_lon = nak_idx * NAKSHATRA_EXTENT
-    # Degrees traversed inside the nakshatra:
-    traversed = moon_longitude - nak_start_lon
-    # Fraction remaining (to be lived):
+    # Degrees traversed inside the nakshatra; fraction remaining is what
+    # is still to be lived of the first period.
+    traversed = lon_mod - _NAK_BREAKS[nak_idx]
     fraction_remaining = 1.0 - (traversed / NAKSHATRA_EXTENT)
 
-    # Total years for this lord:
-    full_duration = DASHA_YEARS[current_lord]
-    balance_years = full_duration * fraction_remaining
-
-    # 4. Generate the Sequence
-    dashas: List[DashaPeriod] = []
-    current_date = birth_date
-
-    # First Dasha (Balance)
-    # Approximate leap years by using 365.25 days per year
-    days_remaining = balance_years * 365.25
-    end_date = current_date + timedelta(days=days_remaining)
-    dashas.append(DashaPeriod(
-        lord=current_lord,
-        start_date=current_date,
-        end_date=end_date,
-        duration_years=balance_years
-    ))
-    current_date = end_date
-
-    # Subsequent Dashas
-    years_generated = balance_years
-    curr_lord_seq_idx = lord_idx
-
-    while years_generated < total_years:
-        # Move to next lord in sequence
-        curr_lord_seq_idx = (curr_lord_seq_idx + 1) % 9
-        next_lord = DASHA_LORDS[curr_lord_seq_idx]
-        duration = DASHA_YEARS[next_lord]
-        end_date = current_date + timedelta(days=duration * 365.25)
-
-        dashas.append(DashaPeriod(
-            lord=next_lord,
-            start_date=current_date,
-            end_date=end_date,
-            duration_years=float(duration)
-        ))
-
-        current_date = end_date
-        years_generated += duration
-
-    return dashas
+    # 4. Generate the sequence vectorized: durations of the repeating lord
+    # cycle, first (balance) period scaled by the remaining fraction, then
+    # cumulative sums give every start/end offset in one pass.
+    # Upper bound on period count: shortest dasha is 6 years.
+    n_max = 2 + int(total_years // min(DASHA_YEARS.values()))
+    seq_idx = (lord_idx + np.arange(n_max)) % 9
+    durations = DASHA_YEARS_SEQ[seq_idx]
+    durations[0] *= fraction_remaining
+
+    ends_years = np.cumsum(durations)
+    # The original loop appends the balance period, then keeps appending
+    # while the running total is strictly below total_years.
+    count = int(np.searchsorted(ends_years, total_years, side="left")) + 1
+    count = min(count, n_max)
+
+    ends_days = ends_years[:count] * DAYS_PER_YEAR
+    starts_days = np.concatenate(([0.0], ends_days[:-1]))
+
+    return [
+        DashaPeriod(
+            lord=DASHA_LORDS[seq_idx[i]],
+            start_date=birth_date + timedelta(days=float(starts_days[i])),
+            end_date=birth_date + timedelta(days=float(ends_days[i])),
+            duration_years=float(durations[i]),
+        )
+        for i in range(count)
+    ]
 
@@ -8,6 +8,8 @@ Includes:
 
 from typing import Dict
 
+import numpy as np
+
 # Constants
 PLANETS = [
     "Sun",
@@ -55,6 +57,21 @@ DEFAULT_NATURAL_RELATIONSHIPS = {
 }
 
 
+PLANET_INDEX = {p: i for i, p in enumerate(PLANETS)}
+
+# Integer codes for the array API: friend +1, neutral 0, enemy -1.
+# Compound codes are simply natural + temporary under this encoding
+# (friend+friend = +2 adhimitra ... enemy+enemy = -2 adhisatru).
+RELATION_CODES = {RELATION_FRIEND: 1, RELATION_NEUTRAL: 0, RELATION_ENEMY: -1}
+COMPOUND_BY_CODE = {
+    2: COMPOUND_ADHIMITRA,
+    1: COMPOUND_MITRA,
+    0: COMPOUND_SAMA,
+    -1: COMPOUND_SATRU,
+    -2: COMPOUND_ADHISATRU,
+}
+
+
 def get_natural_relationship(p1: str, p2: str) -> str:
     """Returns the natural relationship of p1 towards p2."""
     if p1 == p2:
@@ -69,6 +86,61 @@ def get_natural_relationship(p1: str, p2: str) -> str:
     return RELATION_NEUTRAL
 
 
+# (9, 9) int8 matrix of natural relationships in PLANETS order, built once.
+NATURAL_MATRIX = np.array(
+    [
+        [RELATION_CODES[get_natural_relationship(p1, p2)] for p2 in PLANETS]
+        for p1 in PLANETS
+    ],
+    dtype=np.int8,
+)
+
+
+def signs_array(planet_signs: Dict[str, int]) -> np.ndarray:
+    """Planet-indexed int8 sign array for the *_array entry points; -1 marks
+    planets absent from the mapping."""
+    return np.array([planet_signs.get(p, -1) for p in PLANETS], dtype=np.int8)
+
+
+def compute_temporary_maitri_array(signs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Tatkalika Maitri over a planet-indexed sign array.
+
+    Args:
+        signs: int8[9] of sign indices in PLANETS order, -1 for absent.
+
+    Returns:
+        (9, 9) int8 matrix of relation codes (+1 friend / -1 enemy) of row
+        planet towards column planet; 0 on the diagonal and wherever either
+        planet is absent.
+    """
+    count = (signs[np.newaxis, :].astype(np.int16) - signs[:, np.newaxis]) % 12 + 1
+    friend = ((count >= 2) & (count <= 4)) | (count >= 10)
+    out = np.where(friend, 1, -1).astype(np.int8)
+
+    present = signs >= 0
+    out[~present, :] = 0
+    out[:, ~present] = 0
+    np.fill_diagonal(out, 0)
+    return out
+
+
+def compute_compound_maitri_array(signs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Panchadha Maitri: natural + temporary codes, so the result
+    ranges over -2 (adhisatru) .. +2 (adhimitra); see COMPOUND_BY_CODE.
+    Entries for absent planets and the diagonal are 0 (sama).
+    """
+    temp = compute_temporary_maitri_array(signs)
+    out = NATURAL_MATRIX + temp
+
+    present = signs >= 0
+    out[~present, :] = 0
+    out[:, ~present] = 0
+    np.fill_diagonal(out, 0)
+    return out
+
+
 def compute_temporary_maitri(planet_signs: Dict[str, int]) -> Dict[str, Dict[str, str]]:
     """
     Calculates Tatkalika Maitri (Temporary Relationship) based on positions.
@@ -1,6 +1,8 @@
 import numpy as np
 from typing import Tuple, List, Union, Dict
 
+from _kernels import nakshatra_index_pada
+
 # Constants
 NAKSHATRA_NAMES = [
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
@@ -23,18 +25,9 @@ def get_nakshatra_scalar(longitude: float) -> Tuple[int, str, int]:
     Returns:
         (index_0_26, name, pada_1_4)
     """
-    # Normalize
-    lon = longitude % 360.0
-    
-    # Calculate continuous index
-    raw_idx = lon / NAKSHATRA_EXTENT
-    idx = int(raw_idx)
-    
-    # Calculate Pada (Quarter): Each Nakshatra has 4 Padas
-    # Fraction of the nakshatra * 4 -> 0..3.99 -> floor -> +1 -> 1..4
-    fraction = raw_idx - idx
-    pada = int(fraction * 4) + 1
-    
+    # Jitted core (index + pada) when numba is installed; the name lookup
+    # stays out here where strings are cheap.
+    idx, pada = nakshatra_index_pada(float(longitude))
     return idx, NAKSHATRA_NAMES[idx], pada
 
 def get_nakshatra_batch(longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -20,9 +20,12 @@ Units: Virupas (1 Rupa = 60 Virupas).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Mapping, Optional
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
 import math
 
+import numpy as np
+
 from raavi_ephemeris import SkyFrame  # type: ignore
 from .maitri import (
     PLANETS,
@@ -32,7 +35,8 @@ from .maitri import (
     COMPOUND_SATRU,
     COMPOUND_ADHISATRU,
 )
-from .aspects import compute_aspects_for_frame
+from .aspects import DEFAULT_ASPECTS
+from _kernels import drik_bala_totals
 from . import strengths
 
 
@@ -351,10 +355,13 @@ def _hours_from_datetime(dt: Optional["datetime"]) -> Optional[float]:  # type:
     return dt.hour + dt.minute / 60.0 + dt.second / 3600.0
 
 
+@lru_cache(maxsize=4096)
 def _get_vara_index(jd: float) -> int:
     """
     Vara index 0..6 using the same rule as Panchanga:
     int(ceil(jd + 1)) % 7, where 0 = Sunday.
+
+    Cached: transit sweeps ask about the same day for every planet.
     """
     return int(math.ceil(jd + 1.0)) % 7
 
@@ -373,7 +380,45 @@ DAY_STRONG_PLANETS = {"Sun", "Jupiter", "Venus"}
 NIGHT_STRONG_PLANETS = {"Moon", "Mars", "Saturn"}
 
 
-def calculate_kaala_bala(planet: str, frame: SkyFrame) -> float:
+def _kaala_frame_context(
+    frame: SkyFrame,
+) -> Tuple[Optional[float], Optional[float], Optional[str], Optional[str]]:
+    """
+    Frame-level Kaala Bala inputs shared by every planet:
+    (hour_of_day, benefic_phase_score, paksha, vara_lord).
+
+    The hour, Moon phase and weekday lord depend only on the frame, so
+    the aggregate path computes them once instead of once per planet.
+    Entries are None when the frame lacks the data they need.
+    """
+    dt = frame.local_datetime or frame.utc_datetime
+    hour = _hours_from_datetime(dt)
+
+    benefic_score: Optional[float] = None
+    paksha: Optional[str] = None
+    sun_pos = frame.positions.get("Sun")
+    moon_pos = frame.positions.get("Moon")
+    if sun_pos is not None and moon_pos is not None:
+        phase = (_normalize_lon(moon_pos.lon) - _normalize_lon(sun_pos.lon)) % 360.0
+
+        # Distance from New Moon (0 or 360) mapped to 0..180;
+        # 0 at New Moon, 60 at Full Moon.
+        delta = 360.0 - phase if phase > 180.0 else phase
+        benefic_score = 60.0 * (delta / 180.0)
+
+        # Tithi index 0..29, Paksha split at 15
+        paksha = "Shukla" if int(phase // 12.0) % 30 < 15 else "Krishna"
+
+    vara_lord = VARA_LORDS.get(_get_vara_index(frame.jd)) if frame.jd else None
+
+    return hour, benefic_score, paksha, vara_lord
+
+
+def calculate_kaala_bala(
+    planet: str,
+    frame: SkyFrame,
+    context: Optional[Tuple] = None,
+) -> float:
     """
     Kaala Bala (time-based strength) � simplified but structured.
 
@@ -385,51 +430,37 @@ def calculate_kaala_bala(planet: str, frame: SkyFrame) -> float:
     The individual components are combined with heuristic weights and
     clipped to [0, 60] for stability. This gives a realistic, extensible
     structure while staying implementation-light for Phase 7.5.
+
+    `context` is an optional precomputed _kaala_frame_context; the
+    aggregate path passes one so the frame-level pieces are not redone
+    for each of the seven planets.
     """
     if planet not in NAISARGIKA_BALA:
         return 0.0
 
+    hour, benefic_score, paksha, vara_lord = (
+        context if context is not None else _kaala_frame_context(frame)
+    )
+
     # --- Natonnata Bala (time of day) ---
-    dt = frame.local_datetime or frame.utc_datetime
     natonnata = 0.0
-    if dt is not None:
-        hour = _hours_from_datetime(dt)
-        if hour is not None:
-            if planet == "Mercury":
-                natonnata = 60.0
-            elif planet in DAY_STRONG_PLANETS:
-                # Max at 12:00, min at 00:00 / 24:00
-                diff = abs(hour - 12.0)
-                if diff > 12.0:
-                    diff = 24.0 - diff
-                natonnata = max(0.0, 60.0 * (1.0 - diff / 12.0))
-            elif planet in NIGHT_STRONG_PLANETS:
-                # Max at 00:00, min at 12:00
-                diff = min(hour, 24.0 - hour)
-                natonnata = max(0.0, 60.0 * (1.0 - diff / 12.0))
+    if hour is not None:
+        if planet == "Mercury":
+            natonnata = 60.0
+        elif planet in DAY_STRONG_PLANETS:
+            # Max at 12:00, min at 00:00 / 24:00
+            diff = abs(hour - 12.0)
+            if diff > 12.0:
+                diff = 24.0 - diff
+            natonnata = max(0.0, 60.0 * (1.0 - diff / 12.0))
+        elif planet in NIGHT_STRONG_PLANETS:
+            # Max at 00:00, min at 12:00
+            diff = min(hour, 24.0 - hour)
+            natonnata = max(0.0, 60.0 * (1.0 - diff / 12.0))
 
     # --- Paksha Bala (Moon phase) ---
     paksha_bala = 0.0
-    sun_pos = frame.positions.get("Sun")
-    moon_pos = frame.positions.get("Moon")
-    if sun_pos is not None and moon_pos is not None:
-        sun_lon = _normalize_lon(sun_pos.lon)
-        moon_lon = _normalize_lon(moon_pos.lon)
-        phase = (moon_lon - sun_lon) % 360.0
-
-        # Distance from New Moon (0 or 360) mapped to 0..180
-        if phase > 180.0:
-            delta = 360.0 - phase
-        else:
-            delta = phase
-
-        # 0 at New Moon, 60 at Full Moon
-        benefic_score = 60.0 * (delta / 180.0)
-
-        # Tithi index 0..29, Paksha split at 15
-        tithi_index = int(phase // 12.0) % 30
-        paksha = "Shukla" if tithi_index < 15 else "Krishna"
-
+    if benefic_score is not None:
         is_benefic = planet in {"Jupiter", "Venus"} or (
             planet == "Moon" and paksha == "Shukla"
         )
@@ -446,12 +477,7 @@ def calculate_kaala_bala(planet: str, frame: SkyFrame) -> float:
             paksha_bala = 30.0
 
     # --- Vara Bala (weekday lord) ---
-    vara_bala = 0.0
-    if frame.jd:
-        vara_idx = _get_vara_index(frame.jd)
-        vara_lord = VARA_LORDS.get(vara_idx)
-        if vara_lord == planet:
-            vara_bala = 45.0
+    vara_bala = 45.0 if vara_lord == planet else 0.0
 
     # Combine components into a 0..60 band
     combined = 0.4 * natonnata + 0.4 * paksha_bala + 0.2 * vara_bala
@@ -520,11 +546,28 @@ MALEFIC_PLANETS = {"Sun", "Mars", "Saturn"}
 ASPECT_ORB = 6.0
 
 
+_ASPECT_TARGETS = np.array(list(DEFAULT_ASPECTS.values()))
+
+
+def _drik_bala_totals_for_frame(frame: SkyFrame) -> Dict[str, float]:
+    """
+    Signed aspect-strength totals for every body in the frame, from one
+    pass of the pairwise drik_bala_totals kernel (jitted when numba is
+    installed). Totals are pre-compression; callers apply /4 and clipping.
+    """
+    body_list = list(frame.positions)
+    lons = np.array([_normalize_lon(frame.positions[b].lon) for b in body_list])
+    benefic = np.array([b in BENEFIC_PLANETS for b in body_list])
+    malefic = np.array([b in MALEFIC_PLANETS for b in body_list])
+    totals = drik_bala_totals(lons, _ASPECT_TARGETS, ASPECT_ORB, benefic, malefic)
+    return dict(zip(body_list, totals.tolist()))
+
+
 def calculate_drik_bala(planet: str, frame: SkyFrame) -> float:
     """
     Drik Bala (aspect-based strength), simplified.
 
-    Uses the scalar aspect engine with a moderate orb and treats
+    Uses a pairwise aspect kernel with a moderate orb and treats
     aspects from benefics as positive contributions and aspects from
     malefics as negative. The total is compressed into [0, 60].
 
@@ -536,23 +579,7 @@ def calculate_drik_bala(planet: str, frame: SkyFrame) -> float:
     if planet not in NAISARGIKA_BALA:
         return 0.0
 
-    aspects = compute_aspects_for_frame(frame, orb=ASPECT_ORB)
-    total = 0.0
-
-    for _, pairs in aspects.items():
-        for (p1, p2), delta in pairs.items():
-            if planet not in (p1, p2):
-                continue
-            other = p2 if p1 == planet else p1
-
-            if other not in BENEFIC_PLANETS and other not in MALEFIC_PLANETS:
-                continue
-
-            strength = max(0.0, 60.0 * (1.0 - abs(delta) / ASPECT_ORB))
-            if other in BENEFIC_PLANETS:
-                total += strength
-            else:
-                total -= strength
+    total = _drik_bala_totals_for_frame(frame).get(planet, 0.0)
 
     bala = total / 4.0
     if bala < 0.0:
@@ -609,6 +636,92 @@ def calculate_sthana_bala(
     return uchcha + saptavargaja + ojayugma + kendra + drekkana
 
 
+# ---------------------------------------------------------------------------
+# SoA layout for the aggregate computation
+# ---------------------------------------------------------------------------
+
+# The classical planets in a fixed order; every per-planet constant below is
+# also materialized as an array in this order so the aggregate path can run
+# each component over all planets at once instead of per-planet dict lookups.
+SHADBALA_PLANETS: Tuple[str, ...] = tuple(NAISARGIKA_BALA)
+
+_EXALT_ARR = np.array([EXALTATION_POINTS[p] for p in SHADBALA_PLANETS])
+_ZERO_HOUSE_ARR = np.array(
+    [ZERO_STRENGTH_HOUSE[p] for p in SHADBALA_PLANETS], dtype=np.int64
+)
+_NAISARGIKA_ARR = np.array([NAISARGIKA_BALA[p] for p in SHADBALA_PLANETS])
+_AVG_SPEED_ARR = np.array([AVG_SPEED[p] for p in SHADBALA_PLANETS])
+_IS_SUN_MOON = np.array([p in ("Sun", "Moon") for p in SHADBALA_PLANETS])
+# Kendra/Panapara/Apoklima cycle with house % 3 (1->Kendra, 2->Panapara,
+# 0->Apoklima).
+_KENDRA_BALA_BY_MOD = np.array([15.0, 60.0, 30.0])
+# Decanate (0/1/2) in which each planet earns its 15 Virupas of Drekkana Bala.
+_DREKKANA_DECANATE = {
+    "Sun": 0, "Mars": 0, "Jupiter": 0,
+    "Mercury": 1, "Saturn": 1,
+    "Moon": 2, "Venus": 2,
+}
+_DREKKANA_IDX_ARR = np.array(
+    [_DREKKANA_DECANATE[p] for p in SHADBALA_PLANETS], dtype=np.int64
+)
+
+
+def _frame_planets_soa(
+    frame: SkyFrame,
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pull the classical planets present in a frame into parallel arrays:
+    (names, index into SHADBALA_PLANETS, normalized longitudes, speeds).
+
+    Missing speeds become NaN so the vectorized Chesta rule can treat
+    them as "no data" without a per-planet None check.
+    """
+    # Frame order, not SHADBALA_PLANETS order: the result dicts (and the
+    # strong/weak lists derived from them) must keep the caller's sequence.
+    names = [p for p in frame.positions if p in SHADBALA_PLANETS]
+    idx = np.array([SHADBALA_PLANETS.index(p) for p in names], dtype=np.int64)
+    lons = np.array([_normalize_lon(frame.positions[p].lon) for p in names])
+    speeds = np.array(
+        [
+            frame.positions[p].speed_lon
+            if frame.positions[p].speed_lon is not None
+            else np.nan
+            for p in names
+        ]
+    )
+    return names, idx, lons, speeds
+
+
+def _uchcha_bala_array(idx: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_uchcha_bala over the SoA planet arrays."""
+    diff = np.abs(lons - _EXALT_ARR[idx]) % 360.0
+    diff = np.where(diff > 180.0, 360.0 - diff, diff)
+    return np.clip(np.abs(180.0 - diff) / 3.0, 0.0, 60.0)
+
+
+def _dig_bala_array(idx: np.ndarray, houses: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_dig_bala over houses-from-ascendant."""
+    dh = (houses - _ZERO_HOUSE_ARR[idx]) % 12
+    dh = np.where(dh > 6, 12 - dh, dh)
+    return np.clip(dh * 30.0 / 3.0, 0.0, 60.0)
+
+
+def _chesta_bala_array(idx: np.ndarray, speeds: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_chesta_bala; NaN speed means no data (0)."""
+    speed = np.where(_IS_SUN_MOON[idx], np.abs(speeds), speeds)
+    abs_speed = np.abs(speed)
+    return np.select(
+        [
+            np.isnan(speeds),
+            speed < 0.0,
+            abs_speed < STATIONARY_THRESHOLD,
+            abs_speed > _AVG_SPEED_ARR[idx],
+        ],
+        [0.0, 60.0, 15.0, 45.0],
+        default=30.0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Aggregate Shadbala computation
 # ---------------------------------------------------------------------------
@@ -643,50 +756,64 @@ def calculate_shadbala_for_frame(
         - Dig Bala is computed from house_from_asc using sign-based houses.
         - Kaala, Chesta, Drik are simplified but structured.
         - Rahu/Ketu are ignored (not included in output).
+        - The array-shaped components (Uchcha, Dig, Kendra, Drekkana,
+          Chesta, Naisargika) run over all planets at once on the SoA
+          arrays; the dict-shaped ones (Saptavargaja, Ojayugma, Kaala,
+          Drik) stay per-planet.
     """
-    results: Dict[str, ShadbalaComponents] = {}
+    names, idx, lons, speeds = _frame_planets_soa(frame)
+    n = len(names)
 
     houses = frame.houses or {}
     asc_lon: Optional[float] = None
     if isinstance(houses, dict):
         asc_lon = houses.get("asc")
 
-    for planet, pos in frame.positions.items():
-        if planet not in NAISARGIKA_BALA:
-            # Skip nodes in this Shadbala implementation
-            continue
+    uchcha = _uchcha_bala_array(idx, lons)
+    if asc_lon is not None and n:
+        p_signs = np.floor_divide(lons, 30.0).astype(np.int64)
+        houses_arr = (p_signs - _sign_from_lon(asc_lon)) % 12 + 1
+        dig = _dig_bala_array(idx, houses_arr)
+        kendra = _KENDRA_BALA_BY_MOD[houses_arr % 3]
+    else:
+        dig = np.zeros(n)
+        kendra = np.zeros(n)
+
+    dec_idx = np.floor_divide(lons % 30.0, 10.0).astype(np.int64)
+    drekkana = np.where(dec_idx == _DREKKANA_IDX_ARR[idx], 15.0, 0.0)
+    chesta = _chesta_bala_array(idx, speeds)
+    nais = _NAISARGIKA_ARR[idx]
+
+    # One kernel pass covers every planet's Drik Bala; the per-planet
+    # wrapper would redo the pairwise sweep for each of them. Same for
+    # the frame-level Kaala Bala inputs.
+    drik_totals = _drik_bala_totals_for_frame(frame) if n else {}
+    kaala_context = _kaala_frame_context(frame) if n else None
 
-        lon = _normalize_lon(pos.lon)
-
-        house_from_asc: Optional[int] = None
-        dig = 0.0
-        if asc_lon is not None:
-            house_from_asc = _house_from_asc(lon, asc_lon)
-            dig = calculate_dig_bala(planet, house_from_asc)
-
-        # Sthana Bala (full)
-        sthana = calculate_sthana_bala(
-            planet,
-            lon,
-            frame,
-            vargas=vargas,
-            compound_maitri=compound_maitri,
-            house_from_asc=house_from_asc,
+    results: Dict[str, ShadbalaComponents] = {}
+    for i, planet in enumerate(names):
+        saptavargaja = 0.0
+        if vargas is not None and compound_maitri is not None:
+            saptavargaja = _calculate_saptavargaja_bala(
+                planet, vargas, compound_maitri
+            )
+
+        ojayugma = 0.0
+        if vargas is not None:
+            ojayugma = calculate_ojayugma_bala(planet, vargas)
+
+        sthana = (
+            float(uchcha[i]) + saptavargaja + ojayugma
+            + float(kendra[i]) + float(drekkana[i])
         )
 
-        # Other components
-        kaala = calculate_kaala_bala(planet, frame)
-        chesta = calculate_chesta_bala(planet, frame)
-        nais = calculate_naisargika_bala(planet)
-        drik = calculate_drik_bala(planet, frame)
-
         results[planet] = ShadbalaComponents(
             sthana=sthana,
-            dig=dig,
-            kaala=kaala,
-            chesta=chesta,
-            naisargika=nais,
-            drik=drik,
+            dig=float(dig[i]),
+            kaala=calculate_kaala_bala(planet, frame, context=kaala_context),
+            chesta=float(chesta[i]),
+            naisargika=float(nais[i]),
+            drik=min(60.0, max(0.0, drik_totals.get(planet, 0.0) / 4.0)),
         )
 
     return results
@@ -708,28 +835,32 @@ def summarize_shadbala(
     but returns a user-friendly summary with ratios and simple
     Ishta/Kashta scores.
     """
-    summary: Dict[str, Dict[str, float]] = {}
-
-    for planet, comp in shadbala_map.items():
-        total = float(comp.total)
-        rupas = total / 60.0
-        min_req = MIN_SHADBALA_RUPAS.get(planet, 0.0)
-        ratio = (rupas / min_req) if min_req > 0.0 else 0.0
-        ishta = max(0.0, rupas - min_req)
-        kashta = max(0.0, min_req - rupas)
-        status = "Strong" if ratio >= 1.0 and min_req > 0.0 else "Weak"
-
-        summary[planet] = {
-            "total_virupas": round(total, 2),
-            "rupas": round(rupas, 2),
-            "minimum_req": float(min_req),
-            "ratio": round(ratio, 2),
-            "status": status,
-            "ishta_score": round(ishta, 2),
-            "kashta_score": round(kashta, 2),
-        }
+    planets = list(shadbala_map)
+
+    # All the arithmetic runs over planet arrays at once; only the final
+    # dict packaging touches Python scalars.
+    totals = np.array([shadbala_map[p].total for p in planets])
+    min_req = np.array([MIN_SHADBALA_RUPAS.get(p, 0.0) for p in planets])
+
+    rupas = totals / 60.0
+    has_min = min_req > 0.0
+    ratio = np.divide(rupas, min_req, out=np.zeros_like(rupas), where=has_min)
+    ishta = np.maximum(0.0, rupas - min_req)
+    kashta = np.maximum(0.0, min_req - rupas)
+    strong = (ratio >= 1.0) & has_min
 
-    return summary
+    return {
+        planet: {
+            "total_virupas": round(float(totals[i]), 2),
+            "rupas": round(float(rupas[i]), 2),
+            "minimum_req": float(min_req[i]),
+            "ratio": round(float(ratio[i]), 2),
+            "status": "Strong" if strong[i] else "Weak",
+            "ishta_score": round(float(ishta[i]), 2),
+            "kashta_score": round(float(kashta[i]), 2),
+        }
+        for i, planet in enumerate(planets)
+    }
 
 
 def classify_shadbala(
@@ -750,21 +881,17 @@ def classify_shadbala(
             "weak_planets": [...],
         }
     """
-    strong: list[str] = []
-    weak: list[str] = []
+    if not summary:
+        return {"strong_planets": [], "weak_planets": []}
 
-    for planet, data in summary.items():
-        min_req = float(data.get("minimum_req", 0.0))
-        if min_req <= 0.0:
-            # Skip nodes or anything without a meaningful minimum
-            continue
-        status = str(data.get("status", ""))
-        if status == "Strong":
-            strong.append(planet)
-        elif status == "Weak":
-            weak.append(planet)
+    planets = np.array(list(summary))
+    # Nodes and anything without a meaningful minimum are masked out.
+    has_min = np.array(
+        [float(summary[p].get("minimum_req", 0.0)) > 0.0 for p in summary]
+    )
+    status = np.array([str(summary[p].get("status", "")) for p in summary])
 
     return {
-        "strong_planets": strong,
-        "weak_planets": weak,
+        "strong_planets": planets[has_min & (status == "Strong")].tolist(),
+        "weak_planets": planets[has_min & (status == "Weak")].tolist(),
     }
@@ -1,49 +1,54 @@
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
 from raavi_ephemeris_vector import EphemerisBatch
 
-def find_zodiac_ingresses(batch: EphemerisBatch, body_name: str) -> List[Tuple[float, int, int]]:
+IngressEvent = Tuple[float, int, int]
+
+
+def find_zodiac_ingresses(
+    batch: EphemerisBatch,
+    bodies: Optional[Union[str, Sequence[str]]] = None,
+) -> Union[List[IngressEvent], Dict[str, List[IngressEvent]]]:
     """
-    Scans an EphemerisBatch to find when a planet changes Zodiac signs using vectorized logic.
-    
+    Scans an EphemerisBatch for Zodiac sign changes using vectorized logic.
+
+    All requested bodies are scanned in a single pass over the contiguous
+    (N_time, N_body) longitude matrix, so asking for every body costs one
+    sweep instead of one per body.
+
     Args:
         batch: The pre-calculated vector batch.
-        body_name: The name of the body to scan (e.g., "Moon").
-        
+        bodies: A single body name (e.g., "Moon"), a sequence of names, or
+            None for every body in the batch.
+
     Returns:
-        A list of tuples: (JulianDate, From_Sign_Index, To_Sign_Index)
-        The JD returned is the timestamp of the *first* data point in the new sign.
+        For a single name: a list of (JulianDate, From_Sign_Index,
+        To_Sign_Index) tuples, where the JD is the timestamp of the *first*
+        data point in the new sign. Otherwise: a dict of such lists keyed
+        by body name. Unknown names yield empty lists.
     """
-    try:
-        # batch.bodies is a list of strings
-        body_idx = batch.bodies.index(body_name)
-    except ValueError:
-        return []
-
-    # Extract longitudes: Shape (N_time,)
-    # raw_results is (N_time, N_body, 6), index 0 is Longitude
-    longitudes = batch.raw_results[:, body_idx, 0]
-    
-    # Calculate Sign Indices (0..11)
-    # mod 360 handles bounds, floor division by 30 gives sign index
-    signs = np.floor(np.mod(longitudes, 360.0) / 30.0).astype(int)
-    
-    # Find where the sign changes
-    # np.diff returns differences between adjacent elements. != 0 means a change.
-    # prepend=signs[0] ensures the output shape matches the input shape, 
-    # and the first element is never a 'change' relative to itself.
-    changes = np.diff(signs, prepend=signs[0]) != 0
-    
-    # Get indices where changes occurred (True values)
-    change_indices = np.where(changes)[0]
-    
-    events = []
-    for idx in change_indices:
-        jd = float(batch.jds[idx])
-        to_sign = int(signs[idx])
-        from_sign = int(signs[idx-1]) # safe because prepend handled index 0 logic
-        
-        events.append((jd, from_sign, to_sign))
-        
-    return events
+    single = isinstance(bodies, str)
+    names = [bodies] if single else list(bodies) if bodies is not None else list(batch.bodies)
+
+    events: Dict[str, List[IngressEvent]] = {name: [] for name in names}
+    known = [name for name in names if name in batch]
+    if known and len(batch.jds) > 0:
+        # (N_time, n) longitudes for every requested body at once.
+        cols = [batch.index_of(name) for name in known]
+        longitudes = batch.lon[:, cols]
+
+        signs = np.floor(np.mod(longitudes, 360.0) / 30.0).astype(np.int8)
+
+        # changes[t, b] marks a sign boundary between samples t and t+1;
+        # one np.nonzero yields every (time, body) crossing pair.
+        changes = signs[1:] != signs[:-1]
+        t_idx, b_idx = np.nonzero(changes)
+
+        jds = batch.jds
+        for t, b in zip(t_idx.tolist(), b_idx.tolist()):
+            events[known[b]].append(
+                (float(jds[t + 1]), int(signs[t, b]), int(signs[t + 1, b]))
+            )
 
+    return events[bodies] if single else events
@@ -21,6 +21,8 @@ Output:
 
 from typing import Dict, Mapping, Tuple
 
+import numpy as np
+
 
 def _normalize_lon(lon: float) -> float:
     """Normalize any longitude to [0, 360)."""
@@ -230,29 +232,96 @@ _VARGA_FUNCTIONS = {
 }
 
 
+# Harmonic vargas share one formula, so the batched path runs them as a
+# single (lon * D) % 360 op per division instead of a call per planet.
+_HARMONIC_DIVISIONS = {
+    "D4": 4, "D7": 7, "D10": 10, "D12": 12, "D16": 16, "D20": 20,
+    "D24": 24, "D27": 27, "D40": 40, "D45": 45, "D60": 60,
+}
+
+# D9 seed sign by element; elements cycle with sign % 4
+# (fire, earth, air, water).
+_D9_SEEDS = np.array([0, 9, 6, 3], dtype=np.int64)
+
+# D30 piecewise rule encoded as breakpoints + target signs so a
+# searchsorted replaces the if/elif chain.
+_D30_ODD_BREAKS = np.array([5.0, 10.0, 18.0, 25.0])
+_D30_ODD_SIGNS = np.array([0, 10, 8, 2, 6], dtype=np.int64)
+_D30_EVEN_BREAKS = np.array([5.0, 12.0, 20.0, 25.0])
+_D30_EVEN_SIGNS = np.array([1, 5, 11, 9, 7], dtype=np.int64)
+
+
+def _all_varga_arrays(lons: np.ndarray) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Batched core of calculate_all_vargas: one (sign, degree_in_sign) array
+    pair per varga, computed over every planet at once. The scalar
+    functions above remain the readable reference for each rule.
+    """
+    lon_n = np.mod(lons, 360.0)
+    sign = np.floor(lon_n / 30.0).astype(np.int64)
+    deg = lon_n - 30.0 * sign
+
+    out: Dict[str, Tuple[np.ndarray, np.ndarray]] = {"D1": (sign, deg)}
+
+    # D2 Hora: Leo when the half of the sign matches its odd/even parity.
+    is_odd = sign % 2 == 0
+    out["D2"] = (np.where(is_odd == (deg < 15.0), 4, 3), (deg * 2.0) % 30.0)
+
+    # D3 Drekkana: same / 5th / 9th sign by 10-degree third.
+    d3_idx = np.floor_divide(deg, 10.0).astype(np.int64)
+    out["D3"] = ((sign + 4 * d3_idx) % 12, (deg * 3.0) % 30.0)
+
+    # D9 Navamsa: element seed plus the navamsa index within the sign.
+    # floor_divide matches Python's // at exact navamsa boundaries, where
+    # floor(a / b) can land one step high.
+    d9_idx = np.floor_divide(deg, 30.0 / 9.0).astype(np.int64)
+    out["D9"] = ((_D9_SEEDS[sign % 4] + d9_idx) % 12, (deg * 9.0) % 30.0)
+
+    for name, division in _HARMONIC_DIVISIONS.items():
+        vlon = (lon_n * float(division)) % 360.0
+        vsign = np.floor(vlon / 30.0).astype(np.int64)
+        out[name] = (vsign, vlon - 30.0 * vsign)
+
+    # D30 Trimsamsa: piecewise lookup per parity.
+    odd_idx = np.searchsorted(_D30_ODD_BREAKS, deg, side="right")
+    even_idx = np.searchsorted(_D30_EVEN_BREAKS, deg, side="right")
+    out["D30"] = (
+        np.where(is_odd, _D30_ODD_SIGNS[odd_idx], _D30_EVEN_SIGNS[even_idx]),
+        (deg * 30.0) % 30.0,
+    )
+
+    return out
+
+
 def calculate_all_vargas(
     d1_longitudes: Mapping[str, float],
 ) -> Dict[str, Dict[str, Dict[str, float]]]:
     """
     Compute all configured Vargas from D1 longitudes.
 
+    All planets are computed at once per varga on stacked float64 arrays;
+    only the final dict-of-dicts packaging touches Python objects.
+
     Args:
         d1_longitudes: dict[planet_name] = absolute longitude (0..360).
 
     Returns:
         dict[varga_name][planet] = {"sign": int, "degree_in_sign": float}
     """
+    bodies = list(d1_longitudes)
+    lons = np.fromiter(
+        (d1_longitudes[b] for b in bodies), dtype=np.float64, count=len(bodies)
+    )
+    arrays = _all_varga_arrays(lons)
+
+    # Package in _VARGA_FUNCTIONS order so serialized charts keep the
+    # D1..D60 layout the scalar loop produced.
     result: Dict[str, Dict[str, Dict[str, float]]] = {}
-
-    for varga_name, fn in _VARGA_FUNCTIONS.items():
-        per_planet: Dict[str, Dict[str, float]] = {}
-        for body, lon in d1_longitudes.items():
-            sign, deg = fn(lon)
-            per_planet[body] = {
-                "sign": float(sign),
-                "degree_in_sign": float(deg),
-            }
-        result[varga_name] = per_planet
-
+    for varga_name in _VARGA_FUNCTIONS:
+        signs, degs = arrays[varga_name]
+        result[varga_name] = {
+            body: {"sign": float(signs[i]), "degree_in_sign": float(degs[i])}
+            for i, body in enumerate(bodies)
+        }
     return result
 
@@ -169,8 +169,8 @@ def _frame_at_jd(eph: SwissEphemerisProvider, jd_utc: float, lat: float, lon: fl
     """
     Fetch Sun/Moon nirayana longitudes at a given UTC JD via SwissEphemerisProvider.
     """
-    data = eph.calculate_positions(jd_utc, bodies=["Sun", "Moon"])
-    return {"Sun": data["Sun"].lon, "Moon": data["Moon"].lon}
+    data = eph.calculate_positions_array(jd_utc, bodies=["Sun", "Moon"])
+    return {"Sun": data.lon_of("Sun"), "Moon": data.lon_of("Moon")}
 
 
 def _unwrap_phase(prev: float, curr: float) -> float:
@@ -2,7 +2,8 @@ import numpy as np
 import pytz
 import swisseph as swe
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING, Tuple
 from dataclasses import dataclass
 
@@ -19,6 +20,22 @@ class TimeLocation:
     latitude: float = 0.0
     longitude: float = 0.0
 
+    @cached_property
+    def jd_pair(self) -> Tuple[float, float]:
+        """
+        (jd_local, jd_utc), converted once and memoized on the instance.
+
+        TimeLocations are treated as immutable once built; parity suites
+        and sweeps that reuse the same instance across providers then pay
+        for the datetime-to-JD conversion a single time.
+        """
+        return compute_jd_pair(self)
+
+    @property
+    def jd(self) -> float:
+        """UTC Julian day of this instant (memoized via jd_pair)."""
+        return self.jd_pair[1]
+
 @dataclass
 class SkyPosition:
     body_id: BodyID
@@ -30,6 +47,68 @@ class SkyPosition:
     declination: Optional[float] = None
     right_ascension: Optional[float] = None
 
+# One ephemeris row per body as a structured record; 32 bytes per body
+# against ~hundreds for a boxed SkyPosition, and columnar field access
+# (records["lon"]) stays a zero-copy view.
+POSITION_DTYPE = np.dtype(
+    [("lon", "f8"), ("lat", "f8"), ("dist", "f8"), ("speed_lon", "f8")]
+)
+
+
+@dataclass
+class SkyFrameArray:
+    """
+    Structure-of-arrays snapshot of one Julian day.
+
+    The provider writes longitudes/latitudes/distances/speeds straight into
+    preallocated arrays; the per-body SkyPosition dict is only materialized
+    on first access to `positions`, so consumers that read a couple of
+    columns never pay for the object construction.
+    """
+    jd: float
+    names: Tuple[BodyID, ...]
+    lon: np.ndarray
+    lat: np.ndarray
+    dist: np.ndarray
+    speed: np.ndarray
+
+    def lon_of(self, body_name: BodyID) -> float:
+        return float(self.lon[self.names.index(body_name)])
+
+    @cached_property
+    def records(self) -> np.ndarray:
+        """
+        The frame as one (n_bodies,) POSITION_DTYPE structured array.
+
+        Packed once on first access; hot-path consumers index rows
+        (records[i]["lon"]) or whole columns without ever materializing
+        SkyPosition objects.
+        """
+        rec = np.empty(len(self.names), dtype=POSITION_DTYPE)
+        rec["lon"] = self.lon
+        rec["lat"] = self.lat
+        rec["dist"] = self.dist
+        rec["speed_lon"] = self.speed
+        return rec
+
+    def record_of(self, body_name: BodyID) -> np.void:
+        """Structured row for one body (fields: lon, lat, dist, speed_lon)."""
+        return self.records[self.names.index(body_name)]
+
+    @cached_property
+    def positions(self) -> Dict[BodyID, "SkyPosition"]:
+        return {
+            name: SkyPosition(
+                body_id=name,
+                jd=self.jd,
+                lon=float(self.lon[i]),
+                lat=float(self.lat[i]),
+                speed_lon=float(self.speed[i]),
+                distance=float(self.dist[i]),
+            )
+            for i, name in enumerate(self.names)
+        }
+
 @dataclass
 class SkyFrame:
     jd: float
@@ -54,6 +133,10 @@ BODY_IDS: Dict[BodyID, int] = {
     # Ketu is synthesized from Rahu
 }
 
+# Frozen iteration plan over the default bodies: no dict hash lookups on the
+# per-frame hot path, just a contiguous tuple of (name, swe_id) pairs.
+_BODY_PLAN: Tuple[Tuple[BodyID, int], ...] = tuple(BODY_IDS.items())
+
 BASE_FLAGS = swe.FLG_SWIEPH
 SIDEREAL_EXTRA = swe.FLG_SIDEREAL
 RISE_FLAGS = swe.BIT_HINDU_RISING | swe.FLG_TRUEPOS | swe.FLG_SPEED
@@ -69,15 +152,42 @@ def _resolve_sidm(ayanamsa_name: Optional[str]) -> int:
 def localize_datetime(dt_local: datetime, tz: pytz.BaseTzInfo) -> datetime:
     return tz.localize(dt_local)
 
+# JD of the Unix epoch (1970-01-01 00:00 UTC)
+_UNIX_EPOCH_JD = 2440587.5
+_MICROSECONDS_PER_DAY = 86_400e6
+
+def tl_to_jd_utc(dt_local_ns: np.ndarray, tz_offset_hours: float = 0.0) -> np.ndarray:
+    """
+    Convert an array of naive ``numpy.datetime64`` wall-clock values to UTC
+    Julian days using pure integer arithmetic (no pytz, no per-element calls).
+
+    Args:
+        dt_local_ns: datetime64 array (any unit) interpreted as local wall time.
+        tz_offset_hours: fixed UTC offset of that wall time (0.0 for UTC input).
+
+    Returns:
+        float64 array of UTC Julian days.
+    """
+    us = dt_local_ns.astype("datetime64[us]").view("i8") - int(tz_offset_hours * 3600e6)
+    return us * (1.0 / _MICROSECONDS_PER_DAY) + _UNIX_EPOCH_JD
+
 def datetime_to_julian(dt: datetime) -> float:
-    # Ensure UTC
-    if dt.tzinfo is None:
-        dt_utc = dt.replace(tzinfo=pytz.utc)
-    else:
-        dt_utc = dt.astimezone(pytz.utc)
-    # Decimal hour (UT)
-    ut = dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0
-    return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, ut)
+    # Ensure UTC, then delegate to the vectorized datetime64 path.
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    jd = tl_to_jd_utc(np.array([dt], dtype="datetime64[us]"))
+    return float(jd[0])
+
+def datetime_to_julian_array(start: datetime, n: int, step: timedelta) -> np.ndarray:
+    """
+    Julian days for a regular time grid: ``start, start+step, ...`` (n points).
+
+    The start is converted once and the grid is one arange scaled to
+    days, so minute-resolution sweeps over months cost one conversion
+    instead of n Python-level datetime calls.
+    """
+    jd0 = datetime_to_julian(start)
+    return jd0 + np.arange(n) * (step.total_seconds() / 86400.0)
 
 def _tz_offset_hours(tz: Optional[pytz.BaseTzInfo], reference: Optional[datetime]) -> float:
     if tz is None or reference is None:
@@ -89,16 +199,21 @@ def _tz_offset_hours(tz: Optional[pytz.BaseTzInfo], reference: Optional[datetime
     offset = localized.utcoffset()
     return offset.total_seconds() / 3600.0 if offset else 0.0
 
+@lru_cache(maxsize=4096)
+def _jd_pair_cached(ts_us: int, tz_hours: float) -> Tuple[float, float]:
+    """(jd_local, jd_utc) from a UTC timestamp in microseconds."""
+    jd_utc = ts_us * (1.0 / _MICROSECONDS_PER_DAY) + _UNIX_EPOCH_JD
+    return jd_utc + tz_hours / 24.0, jd_utc
+
 def compute_jd_pair(time_location: TimeLocation) -> Tuple[float, float]:
     tz_hours = _tz_offset_hours(time_location.tz, time_location.dt_local or time_location.dt_utc)
     if time_location.dt_utc:
         dt_utc = time_location.dt_utc
         if dt_utc.tzinfo is None:
             dt_utc = dt_utc.replace(tzinfo=timezone.utc)
-        jd_utc = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
-                            dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0)
-        jd_local = jd_utc + tz_hours / 24.0 if time_location.tz else jd_utc
-        return jd_local, jd_utc
+        # Repeated frames for the same instant (test suites, chart reruns)
+        # hit the cache instead of redoing the datetime arithmetic.
+        return _jd_pair_cached(round(dt_utc.timestamp() * 1e6), tz_hours)
 
     if not time_location.dt_local:
         raise ValueError("Either dt_local or dt_utc must be provided.")
@@ -151,6 +266,22 @@ class SwissEphemerisProvider:
         if self.sidereal:
             self.flags |= SIDEREAL_EXTRA | RISE_FLAGS
 
+        # Resolve swisseph IDs once; the per-frame loops then iterate a
+        # frozen tuple instead of hashing into BODY_IDS per body.
+        self._plan = self._build_plan(self.bodies)
+
+    def _build_plan(self, bodies: List[BodyID]) -> Tuple[Tuple[BodyID, int], ...]:
+        rahu_id = swe.MEAN_NODE if self.node_mode == "mean" else swe.TRUE_NODE
+        names = [name for name in bodies if name == "Rahu" or name in BODY_IDS]
+        # Ketu is synthesized from Rahu, so a Ketu-only request still needs
+        # Rahu computed internally; consumers drop it again unless asked
+        # to keep it.
+        if "Ketu" in bodies and "Rahu" not in names:
+            names.append("Rahu")
+        return tuple(
+            (name, rahu_id if name == "Rahu" else BODY_IDS[name]) for name in names
+        )
+
     def calculate_positions(
         self,
         jd_utc: float,
@@ -164,17 +295,10 @@ class SwissEphemerisProvider:
         full TimeLocation round-trip.
         """
         target_bodies = bodies or self.bodies
+        plan = self._plan if bodies is None else self._build_plan(bodies)
         positions: Dict[BodyID, SkyPosition] = {}
         with ayanamsa_guard(self.sidereal, self.ayanamsa):
-            for body_name in target_bodies:
-                if body_name == "Ketu":
-                    continue
-                if body_name == "Rahu":
-                    body_id = swe.MEAN_NODE if self.node_mode == "mean" else swe.TRUE_NODE
-                else:
-                    body_id = BODY_IDS.get(body_name)
-                if body_id is None:
-                    continue
+            for body_name, body_id in plan:
                 res = swe.calc_ut(jd_utc, body_id, self.flags)
                 data = res[0]
                 positions[body_name] = SkyPosition(
@@ -198,21 +322,73 @@ class SwissEphemerisProvider:
                     speed_lon=rahu.speed_lon,
                     distance=rahu.distance,
                 )
+                if "Rahu" not in target_bodies:
+                    # Rahu was computed only on Ketu's behalf.
+                    del positions["Rahu"]
         return positions
 
-    def get_sky_frame(self, time_location: TimeLocation) -> SkyFrame:
-        jd_local, jd_utc = compute_jd_pair(time_location)
+    def calculate_positions_array(
+        self,
+        jd_utc: float,
+        bodies: Optional[List[BodyID]] = None,
+    ) -> SkyFrameArray:
+        """
+        SoA variant of `calculate_positions`: fills preallocated arrays in
+        the swe.calc_ut loop instead of constructing one SkyPosition per
+        body. The dict view is built lazily by SkyFrameArray.positions.
+        """
+        target_bodies = bodies or self.bodies
+        plan = self._plan if bodies is None else self._build_plan(bodies)
+        want_ketu = "Ketu" in target_bodies and any(n == "Rahu" for n, _ in plan)
+
+        n = len(plan) + (1 if want_ketu else 0)
+        lon = np.empty(n)
+        lat = np.empty(n)
+        dist = np.empty(n)
+        speed = np.empty(n)
+        names: List[BodyID] = []
+
+        with ayanamsa_guard(self.sidereal, self.ayanamsa):
+            for i, (body_name, body_id) in enumerate(plan):
+                data = swe.calc_ut(jd_utc, body_id, self.flags)[0]
+                lon[i] = data[0]
+                lat[i] = data[1]
+                dist[i] = data[2]
+                speed[i] = data[3]
+                names.append(body_name)
+
+        if want_ketu:
+            r = names.index("Rahu")
+            k = len(plan)
+            lon[k] = (lon[r] + 180.0) % 360.0
+            lat[k] = lat[r] if self.ketu_lat_mode == "pyjhora" else -lat[r]
+            dist[k] = dist[r]
+            speed[k] = speed[r]
+            names.append("Ketu")
+            if "Rahu" not in target_bodies:
+                # Rahu was computed only on Ketu's behalf; drop its row.
+                keep = np.arange(len(names)) != r
+                names.pop(r)
+                lon, lat, dist, speed = lon[keep], lat[keep], dist[keep], speed[keep]
+
+        return SkyFrameArray(
+            jd=jd_utc, names=tuple(names), lon=lon, lat=lat, dist=dist, speed=speed
+        )
+
+    def get_sky_frame(
+        self, time_location: TimeLocation, return_internal: bool = False
+    ) -> SkyFrame:
+        """
+        Full SkyFrame for a TimeLocation.
+
+        `return_internal=True` keeps bodies computed only as intermediates
+        (currently: the Rahu behind a Ketu-only request) in the frame, so
+        callers who can use them get them for free.
+        """
+        jd_local, jd_utc = time_location.jd_pair
         positions: Dict[BodyID, SkyPosition] = {}
         with ayanamsa_guard(self.sidereal, self.ayanamsa):
-            for body_name in self.bodies:
-                if body_name == "Ketu":
-                    continue
-                if body_name == "Rahu":
-                    body_id = swe.MEAN_NODE if self.node_mode == "mean" else swe.TRUE_NODE
-                else:
-                    body_id = BODY_IDS.get(body_name)
-                if body_id is None:
-                    continue
+            for body_name, body_id in self._plan:
                 res = swe.calc_ut(jd_utc, body_id, self.flags)
                 data = res[0]
                 positions[body_name] = SkyPosition(
@@ -236,6 +412,9 @@ class SwissEphemerisProvider:
                     speed_lon=rahu.speed_lon,
                     distance=rahu.distance,
                 )
+                if "Rahu" not in self.bodies and not return_internal:
+                    # Rahu was computed only on Ketu's behalf.
+                    del positions["Rahu"]
 
         houses = None
         if self.calculate_houses:
@@ -269,7 +448,7 @@ class VectorizedAdapter:
         self.bodies = vector_provider.bodies
 
     def get_sky_frame(self, time_location: TimeLocation) -> SkyFrame:
-        _, jd_utc = compute_jd_pair(time_location)
+        _, jd_utc = time_location.jd_pair
         batch = self._backend.calculate_batch(np.array([jd_utc]))
         lazy_frame = batch.get_frame(0)
 
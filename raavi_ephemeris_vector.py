@@ -1,49 +1,206 @@
+import os
+
 import numpy as np
 import swisseph as swe
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 from raavi_ephemeris import (
     BODY_IDS,
     BASE_FLAGS,
     SIDEREAL_EXTRA,
     RISE_FLAGS,
-    ayanamsa_guard,
+    _resolve_sidm,
     compute_jd_pair,
+    tl_to_jd_utc,
 )
 
-@dataclass
+from _kernels import synth_ketu
+
+# Batched per-body entry point (one FFI crossing per body instead of per
+# (jd, body) pair) when the installed pyswisseph exposes it. The build
+# pinned here (2.10.x) statically links libswe into the extension module,
+# so there is no shared-library handle to reach the C symbol directly;
+# the per-call loop below is the fallback.
+_CALC_UT_BATCH = getattr(swe, "calc_ut_batch", None)
+
+# Meeus mean-node polynomial in Julian centuries from J2000 (highest
+# order last; reversed below for np.polyval). Agrees with Swiss
+# Ephemeris' mean node to ~0.005 deg over 1900-2100 — good enough for
+# sweeps that bucket into signs/nakshatras, not for parity-grade work,
+# hence the analytic path is opt-in.
+_MEAN_NODE_COEFFS = np.array(
+    [125.0445479, -1934.1362891, 0.0020754, 1.0 / 467441.0, -1.0 / 60616000.0]
+)
+_MEAN_NODE_POLY = _MEAN_NODE_COEFFS[::-1]
+_MEAN_NODE_POLY_DERIV = np.polyder(_MEAN_NODE_POLY) / 36525.0  # deg/day
+# The mean node's latitude is identically zero and its distance constant.
+_MEAN_NODE_DIST_AU = 0.0025695552898
+
+
+def _fill_mean_node(jds: np.ndarray, out: np.ndarray, col: int, want_speed: bool) -> None:
+    """Write closed-form mean-node rows into one body column of `out`."""
+    n = len(jds)
+    T = (jds - 2451545.0) / 36525.0
+    out[:n, col, :] = 0.0
+    out[:n, col, 0] = np.polyval(_MEAN_NODE_POLY, T) % 360.0
+    out[:n, col, 2] = _MEAN_NODE_DIST_AU
+    if want_speed:
+        out[:n, col, 3] = np.polyval(_MEAN_NODE_POLY_DERIV, T)
+
+# Per-process provider cache for calculate_batch_parallel workers. Each
+# worker process rebuilds its provider (and with it the swisseph globals:
+# ephe path, sidereal mode) once per configuration, then reuses it across
+# tiles submitted to that process.
+_WORKER_PROVIDERS: Dict[tuple, "VectorizedProvider"] = {}
+
+
+def _provider_from_config(config: tuple) -> "VectorizedProvider":
+    (ephe_path, bodies, sidereal, ayanamsa, node_mode, ketu_lat_mode,
+     dtype, want_speed, analytic_mean_node) = config
+    return VectorizedProvider(
+        ephe_path=ephe_path,
+        bodies=list(bodies),
+        sidereal=sidereal,
+        ayanamsa=ayanamsa,
+        node_mode=node_mode,
+        ketu_lat_mode=ketu_lat_mode,
+        dtype=np.dtype(dtype),
+        want_speed=want_speed,
+        analytic_mean_node=analytic_mean_node,
+    )
+
+
+def _worker_init(config: tuple) -> None:
+    """Pool initializer: build this worker's provider once, at spawn."""
+    _WORKER_PROVIDERS[config] = _provider_from_config(config)
+
+
+def _worker_calc_tile(config: tuple, jds: np.ndarray) -> np.ndarray:
+    provider = _WORKER_PROVIDERS.get(config)
+    if provider is None:  # the initializer normally ran already
+        provider = _WORKER_PROVIDERS.setdefault(config, _provider_from_config(config))
+    return provider.calculate_batch(jds).raw_results
+
 class LazySkyPosition:
-    longitude: float
-    latitude: float
-    distance_au: float
-    speed_lon: float
+    """
+    View over one (body, time) row of the batch result array.
+
+    Stores only the ndarray row reference; field access reads straight from
+    the shared buffer instead of boxing four floats per position.
+    """
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: np.ndarray):
+        self._row = row
+
+    @property
+    def longitude(self) -> float:
+        return self._row[0]
+
+    @property
+    def latitude(self) -> float:
+        return self._row[1]
+
+    @property
+    def distance_au(self) -> float:
+        return self._row[2]
+
+    @property
+    def speed_lon(self) -> float:
+        return self._row[3]
 
-@dataclass
 class LazySkyFrame:
-    jd: float
-    positions: Dict[str, LazySkyPosition]
+    """
+    One time-slice of an EphemerisBatch.
+
+    Positions are materialized on first `get_position` call and memoized;
+    callers that touch one or two bodies per frame never pay for the rest.
+    """
+
+    __slots__ = ("jd", "_raw_slice", "_bodies", "_body_index", "_cache")
+
+    def __init__(
+        self,
+        jd: float,
+        raw_slice: np.ndarray,
+        bodies: List[str],
+        body_index: Dict[str, int],
+    ):
+        self.jd = jd
+        self._raw_slice = raw_slice
+        self._bodies = bodies
+        self._body_index = body_index
+        self._cache: Dict[str, LazySkyPosition] = {}
 
     def get_position(self, body_name: str) -> LazySkyPosition:
-        return self.positions[body_name]
+        pos = self._cache.get(body_name)
+        if pos is None:
+            row = self._raw_slice[self._body_index[body_name]]
+            pos = LazySkyPosition(row)
+            self._cache[body_name] = pos
+        return pos
+
+    @property
+    def positions(self) -> Dict[str, LazySkyPosition]:
+        # Eager view kept for callers that want the full dict.
+        return {name: self.get_position(name) for name in self._bodies}
 
 @dataclass
 class EphemerisBatch:
     jds: np.ndarray
-    raw_results: np.ndarray 
+    raw_results: np.ndarray
     bodies: List[str]
 
+    def __post_init__(self):
+        self._body_index = {name: i for i, name in enumerate(self.bodies)}
+
+    def index_of(self, body_name: str) -> int:
+        """Column index of a body, without an O(B) list scan."""
+        return self._body_index[body_name]
+
+    def __contains__(self, body_name: str) -> bool:
+        """O(1) `"Moon" in batch` membership over the batch's bodies."""
+        return body_name in self._body_index
+
+    # SoA views: one contiguous (T, B) array per component, so downstream
+    # vector math (aspects, sign bucketing) scans stride-1 memory instead of
+    # striding across the 6-wide component axis. The swisseph fill stays
+    # time-major — each calc_ut 6-tuple lands as one contiguous row write —
+    # and the component-major (6, T, B) block is built in a single transpose
+    # copy on first SoA access; the per-component properties are free views
+    # into it.
+
+    @cached_property
+    def _component_major(self) -> np.ndarray:
+        return np.ascontiguousarray(self.raw_results.transpose(2, 0, 1))
+
+    @property
+    def lon(self) -> np.ndarray:
+        return self._component_major[0]
+
+    @property
+    def lat(self) -> np.ndarray:
+        return self._component_major[1]
+
+    @property
+    def dist(self) -> np.ndarray:
+        return self._component_major[2]
+
+    @property
+    def speed_lon(self) -> np.ndarray:
+        return self._component_major[3]
+
     def get_frame(self, index: int) -> LazySkyFrame:
-        jd = self.jds[index]
-        lazy_positions: Dict[str, LazySkyPosition] = {}
-        time_results = self.raw_results[index] 
-        
-        for i, body_name in enumerate(self.bodies):
-            pos_data = time_results[i]
-            lazy_positions[body_name] = LazySkyPosition(
-                longitude=pos_data[0], latitude=pos_data[1],
-                distance_au=pos_data[2], speed_lon=pos_data[3],
-            )
-        return LazySkyFrame(jd=jd, positions=lazy_positions)
+        return LazySkyFrame(
+            jd=self.jds[index],
+            raw_slice=self.raw_results[index],
+            bodies=self.bodies,
+            body_index=self._body_index,
+        )
 
 class VectorizedProvider:
     def __init__(
@@ -54,34 +211,226 @@ class VectorizedProvider:
         ayanamsa: str = "LAHIRI",
         node_mode: str = "mean",
         ketu_lat_mode: str = "pyjhora",
+        dtype: np.dtype = np.float64,
+        want_speed: bool = False,
+        analytic_mean_node: bool = False,
     ):
         self.bodies = bodies or list(BODY_IDS.keys())
-        self.body_ids = [BODY_IDS[b] for b in self.bodies]
         self.sidereal = sidereal
         self.ayanamsa = ayanamsa
         self.node_mode = node_mode
         self.ketu_lat_mode = ketu_lat_mode
+        # Output dtype for batch results. float32 halves memory traffic for
+        # bulk sweeps where ~1e-3 deg precision is enough (aspect masks,
+        # sign/nakshatra bucketing); callers needing full Swiss Ephemeris
+        # precision (ayanamsa checks, distances in AU) keep float64.
+        self.dtype = np.dtype(dtype)
+
+        # Ketu is synthesized from Rahu, never queried from swisseph directly.
+        self._calc_body_names = [b for b in self.bodies if b != "Ketu"]
+        if "Ketu" in self.bodies and "Rahu" not in self._calc_body_names:
+            self._calc_body_names.append("Rahu")
+        self.body_ids = [self._resolve_body_id(b) for b in self._calc_body_names]
+
+        # Destination column in the final (T, B, 6) array for each calc body;
+        # swisseph rows are written straight into final layout, so Ketu needs
+        # no intermediate copy at all. A Rahu computed only on Ketu's behalf
+        # lands directly in Ketu's column and is fixed up in place.
+        if "Ketu" in self.bodies:
+            self._ketu_final_idx = self.bodies.index("Ketu")
+            self._calc_dest_idx = [
+                self.bodies.index(n) if n in self.bodies else self._ketu_final_idx
+                for n in self._calc_body_names
+            ]
+            self._rahu_src_idx = (
+                self.bodies.index("Rahu") if "Rahu" in self.bodies else self._ketu_final_idx
+            )
+        else:
+            self._ketu_final_idx = None
+            self._calc_dest_idx = list(range(len(self._calc_body_names)))
+            self._rahu_src_idx = None
+
+        # Opt-in closed-form mean node: Rahu's column (which may be Ketu's
+        # stand-in) is filled by one Horner evaluation over the JD array
+        # instead of per-JD Swiss calls. Tropical mean node only — the
+        # polynomial knows nothing about ayanamsas or the true node — and
+        # off by default because it agrees with Swiss only to ~0.005 deg.
+        self.analytic_mean_node = bool(
+            analytic_mean_node and node_mode == "mean" and not sidereal
+        )
+        self._analytic_node_col: Optional[int] = None
+        if self.analytic_mean_node and "Rahu" in self._calc_body_names:
+            rahu_b = self._calc_body_names.index("Rahu")
+            self._analytic_node_col = self._calc_dest_idx[rahu_b]
+        # (dest column, swisseph id) pairs actually sent to Swiss.
+        self._swiss_dest_ids = [
+            (self._calc_dest_idx[b], self.body_ids[b])
+            for b, name in enumerate(self._calc_body_names)
+            if not (self._analytic_node_col is not None and name == "Rahu")
+        ]
+
+        self.ephe_path = ephe_path
         if ephe_path:
             swe.set_ephe_path(ephe_path)
         self.flags = BASE_FLAGS
         if self.sidereal:
             self.flags |= SIDEREAL_EXTRA | RISE_FLAGS
+        # FLG_SPEED roughly doubles the per-body work inside Swiss Ephemeris
+        # (a second evaluation around jd); most batch consumers (nakshatra,
+        # sign, dasha sweeps) only need longitude, so it is opt-in.
+        # Retrograde-detection paths must pass want_speed=True.
+        if want_speed:
+            self.flags |= swe.FLG_SPEED
+        self.want_speed = bool(self.flags & swe.FLG_SPEED)
 
-    def calculate_batch(self, jds: np.ndarray) -> EphemerisBatch:
-        # Collect results in Python lists to avoid per-element NumPy assignment overhead.
-        collected_data = []
+        # The sidereal mode is constant for the life of the provider; set it
+        # once here instead of toggling the swisseph global (and resetting it)
+        # around every batch. _ensure_sid_mode re-asserts it cheaply per call
+        # in case another provider instance switched the global in between.
+        self._sidm = _resolve_sidm(self.ayanamsa) if self.sidereal else None
+        if self._sidm is not None:
+            swe.set_sid_mode(self._sidm, 0, 0)
 
-        calc_ut = swe.calc_ut
+    def _ensure_sid_mode(self) -> None:
+        if self._sidm is not None:
+            swe.set_sid_mode(self._sidm, 0, 0)
+
+    def _resolve_body_id(self, body_name: str) -> int:
+        if body_name == "Rahu":
+            return swe.MEAN_NODE if self.node_mode == "mean" else swe.TRUE_NODE
+        return BODY_IDS[body_name]
+
+    def _fill(self, jds: np.ndarray, out: np.ndarray) -> None:
+        """Fill out[:len(jds)] with swisseph rows for every calc body."""
+        self._ensure_sid_mode()
         flags = self.flags
+        swiss_dest_ids = self._swiss_dest_ids
 
-        with ayanamsa_guard(self.sidereal, self.ayanamsa):
-            for body_id in self.body_ids:
-                body_results = [calc_ut(jd, body_id, flags)[0] for jd in jds]
-                collected_data.append(body_results)
+        if self._analytic_node_col is not None:
+            _fill_mean_node(jds, out, self._analytic_node_col, self.want_speed)
 
-        # collected_data: (num_bodies, num_jds, 6)
-        # We need: (num_jds, num_bodies, 6)
-        raw_results = np.array(collected_data, dtype=np.float64).transpose(1, 0, 2)
+        if _CALC_UT_BATCH is not None:
+            for dest, body_id in swiss_dest_ids:
+                out[: len(jds), dest, :] = _CALC_UT_BATCH(jds, body_id, flags)
+            return
+
+        # JD-outer iteration lets Swiss Ephemeris reuse its cached per-JD
+        # state (nutation, sidereal time, Earth position) across bodies.
+        calc_ut = swe.calc_ut
+        for j, jd in enumerate(jds):
+            row = out[j]
+            for dest, body_id in swiss_dest_ids:
+                row[dest] = calc_ut(jd, body_id, flags)[0]
+
+    def calculate_batch(self, jds: np.ndarray) -> EphemerisBatch:
+        # Preallocated C-contiguous output removes the old list-of-lists +
+        # np.array(...).transpose round-trip.
+        jds = np.asarray(jds, dtype=np.float64)
+        raw_results = np.empty((len(jds), len(self.bodies), 6), dtype=self.dtype)
+
+        self._fill(jds, raw_results)
+
+        if self._ketu_final_idx is not None:
+            synth_ketu(
+                raw_results,
+                self._rahu_src_idx,
+                self._ketu_final_idx,
+                self.ketu_lat_mode != "pyjhora",
+            )
 
         return EphemerisBatch(jds=jds, raw_results=raw_results, bodies=self.bodies)
 
+    def calculate_batch_from_datetimes(
+        self, datetimes: np.ndarray, tz_offset_hours: float = 0.0
+    ) -> EphemerisBatch:
+        """
+        calculate_batch for an array of datetimes.
+
+        Accepts anything np.asarray can coerce to datetime64[us] (naive
+        datetime objects, datetime64 arrays, ISO strings) and converts the
+        whole array to JD in one integer broadcast via tl_to_jd_utc,
+        instead of a per-element datetime_to_julian comprehension.
+        """
+        dt64 = np.asarray(datetimes, dtype="datetime64[us]")
+        return self.calculate_batch(tl_to_jd_utc(dt64, tz_offset_hours))
+
+    def calculate_batch_iter(self, jds: np.ndarray, tile: int = 4096):
+        """
+        Yield (jds_tile, raw_tile) pairs of at most `tile` JDs each.
+
+        Both buffers are preallocated once and reused across tiles so the
+        hot (tile, B, 6) slab stays resident in cache while a fused
+        consumer (aspect scan, sign bucketing, JSON emit) processes it.
+        Consumers must copy a tile if they need it after the next step.
+        """
+        jds = np.asarray(jds, dtype=np.float64)
+        n_buf = min(tile, len(jds))
+        buf = np.empty((n_buf, len(self.bodies), 6), dtype=self.dtype)
+
+        for start in range(0, len(jds), tile):
+            jds_tile = jds[start:start + tile]
+            n = len(jds_tile)
+            self._fill(jds_tile, buf)
+
+            if self._ketu_final_idx is not None:
+                synth_ketu(
+                    buf[:n],
+                    self._rahu_src_idx,
+                    self._ketu_final_idx,
+                    self.ketu_lat_mode != "pyjhora",
+                )
+            yield jds_tile, buf[:n]
+
+    def _config_key(self) -> tuple:
+        return (
+            self.ephe_path,
+            tuple(self.bodies),
+            self.sidereal,
+            self.ayanamsa,
+            self.node_mode,
+            self.ketu_lat_mode,
+            self.dtype.str,
+            self.want_speed,
+            self.analytic_mean_node,
+        )
+
+    def calculate_batch_parallel(
+        self,
+        jds: np.ndarray,
+        nproc: Optional[int] = None,
+        min_parallel: int = 1000,
+    ) -> EphemerisBatch:
+        """
+        calculate_batch split across worker processes.
+
+        Swisseph holds the GIL for much of each call, so threads do not
+        scale; independent JDs do, one tile per process. Each worker keeps
+        its own provider (ephe path, sidereal mode set once per process)
+        and small batches fall through to the single-process path, where
+        process spawn would cost more than it saves.
+        """
+        jds = np.asarray(jds, dtype=np.float64)
+        nproc = nproc or os.cpu_count() or 1
+        if len(jds) < min_parallel or nproc <= 1:
+            return self.calculate_batch(jds)
+
+        tiles = np.array_split(jds, nproc)
+        config = self._config_key()
+        # Spawn, never fork: numba's threading layer is fork-unsafe, so a
+        # parent that has run any jitted kernel (e.g. synth_ketu in a prior
+        # calculate_batch) would hang at interpreter exit after forking.
+        # Spawned workers start clean and set themselves up via the
+        # initializer instead of inheriting parent state.
+        with ProcessPoolExecutor(
+            max_workers=nproc,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_worker_init,
+            initargs=(config,),
+        ) as pool:
+            parts = list(pool.map(_worker_calc_tile, [config] * len(tiles), tiles))
+
+        return EphemerisBatch(
+            jds=jds,
+            raw_results=np.concatenate(parts, axis=0),
+            bodies=self.bodies,
+        )
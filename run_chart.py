@@ -1,6 +1,6 @@
 import pytz
 from datetime import datetime
-from chart_calculator import ChartCalculator
+from chart_calculator import get_default_calculator
 
 
 def main():
@@ -15,7 +15,7 @@ def main():
 
     print(f"--- Calculating Chart for {local_dt} (Tehran, converted to {utc_dt} UTC) ---")
 
-    calc = ChartCalculator()
+    calc = get_default_calculator()
     json_output = calc.calculate_json(utc_dt, lat, lon, name="Test User")
 
     print(json_output)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytz
 from datetime import datetime
-from chart_calculator import ChartCalculator
+from chart_calculator import get_default_calculator
 import os
 
 
@@ -17,7 +17,7 @@ def main():
 
     print(f"Calculating chart for Mehran at local {local_dt} (UTC {utc_dt})")
 
-    calc = ChartCalculator()
+    calc = get_default_calculator()
     json_output = calc.calculate_json(utc_dt, lat, lon, name="Mehran")
 
     # Ensure output directory exists
@@ -5,7 +5,7 @@ from datetime import datetime
 
 import pytz
 
-from chart_calculator import ChartCalculator
+from chart_calculator import get_default_calculator
 
 
 def main():
@@ -20,7 +20,7 @@ def main():
         f"Calculating SIDEREAL (Lahiri) chart for Mehran at local {local_dt} (UTC {utc_dt})"
     )
 
-    calc = ChartCalculator(sidereal=True, ayanamsa="LAHIRI")
+    calc = get_default_calculator(sidereal=True, ayanamsa="LAHIRI")
     json_output = calc.calculate_json(utc_dt, lat, lon, name="Mehran (Sidereal)")
 
     os.makedirs("output", exist_ok=True)
@@ -3,3 +3,121 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from functools import lru_cache
+
+import pytest
+import swisseph as swe
+
+from raavi_ephemeris import get_default_provider
+
+
+@lru_cache(maxsize=4096)
+def _ayanamsa_at_quantized(jd_q: int) -> float:
+    return swe.get_ayanamsa_ut(jd_q / 1e6)
+
+
+def ayanamsa_at(jd: float) -> float:
+    """swe.get_ayanamsa_ut cached on the JD quantized to 1e-6 day (~86 ms);
+    the ayanamsa drifts ~50 arcsec/year, so repeats at the same instant are
+    pure cache hits."""
+    return _ayanamsa_at_quantized(round(jd * 1e6))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _swe_setup():
+    # Swisseph state (ephe path, sidereal mode) is owned by the providers,
+    # which set it on construction and re-assert it per batch; no test
+    # should touch the globals directly, or it invalidates swisseph's
+    # internal caches for everything after it. Session teardown closes the
+    # ephemeris files swisseph keeps open between calls.
+    yield
+    swe.close()
+
+# Providers shared across the whole test session, keyed on their full
+# configuration. Each construction re-reads ephemeris tables and resets
+# swisseph globals, so parity tests that need the same configuration five
+# times should not pay for it five times.
+_PROVIDER_CACHE = {}
+
+
+def cached_default_provider(**kwargs):
+    key = tuple(
+        sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in kwargs.items()
+        )
+    )
+    provider = _PROVIDER_CACHE.get(key)
+    if provider is None:
+        provider = _PROVIDER_CACHE[key] = get_default_provider(**kwargs)
+    return provider
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_kernels():
+    # The first call into each @njit kernel pays the JIT compile (the
+    # kernels use cache=True, but a cold cache still compiles); warm them
+    # on tiny inputs so the cost is not charged to whichever test happens
+    # to run first. Effectively free when numba is not installed.
+    import numpy as np
+
+    import _kernels
+
+    lon = np.zeros((1, 2))
+    _kernels.pairwise_abs_angle_diff(lon)
+    _kernels.aspect_masks(lon, np.array([0.0]), 1.0)
+    _kernels.synth_ketu(np.zeros((1, 2, 6)), 0, 1, False)
+    _kernels.drik_bala_totals(
+        np.zeros(2), np.array([0.0]), 1.0,
+        np.zeros(2, dtype=bool), np.zeros(2, dtype=bool),
+    )
+
+
+@pytest.fixture(scope="session")
+def scalar_provider():
+    return cached_default_provider(use_vector_engine=False)
+
+
+@pytest.fixture(scope="session")
+def vector_provider():
+    return cached_default_provider(use_vector_engine=True)
+
+
+@pytest.fixture(scope="session")
+def panchanga_provider():
+    # The sidereal Sun/Moon configuration every panchanga test uses.
+    return cached_default_provider(
+        use_vector_engine=False,
+        sidereal=True,
+        ayanamsa="LAHIRI",
+        calculate_houses=False,
+        bodies=["Sun", "Moon"],
+    )
+
+
+@pytest.fixture(scope="session")
+def tehran_panchanga_1997(panchanga_provider):
+    # The Tehran 1997-06-07 06:00 panchanga all three panchanga test files
+    # assert against, computed once with end times enabled. The sampled
+    # sunrise-to-sunrise sweep inside compute_panchanga is the dominant
+    # cost of those files.
+    import pytz
+    from datetime import datetime
+
+    from raavi_ephemeris import TimeLocation
+    from panchanga_engine import compute_panchanga, PanchangaConfig
+
+    # Localize once here; compute_jd_pair prefers dt_utc, which skips
+    # pytz's transition-table walk, while dt_local keeps the civil-day
+    # sunrise window anchored.
+    tehran = pytz.timezone("Asia/Tehran")
+    dt_local = datetime(1997, 6, 7, 6, 0, 0)
+    tl = TimeLocation(
+        dt_utc=tehran.localize(dt_local).astimezone(pytz.utc),
+        dt_local=dt_local,
+        tz=tehran,
+        latitude=35.6892,
+        longitude=51.3890,
+    )
+    config = PanchangaConfig(compute_end_times=True, samples_per_day=7)
+    return compute_panchanga(tl, panchanga_provider, config=config)
@@ -1,16 +1,14 @@
-import pytz
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timezone
 
-from raavi_ephemeris import TimeLocation, get_default_provider
+from raavi_ephemeris import TimeLocation, datetime_to_julian
 from logic.aspects import compute_aspects_for_frame, compute_aspects_for_batch, DEFAULT_ASPECTS
 
 
-def test_scalar_aspects_basic():
+def test_scalar_aspects_basic(scalar_provider):
     # Pick an arbitrary time
-    tl = TimeLocation(dt_utc=datetime(2000, 1, 1, 12, 0, 0, tzinfo=pytz.utc))
-    provider = get_default_provider(use_vector_engine=False)
-    frame = provider.get_sky_frame(tl)
+    tl = TimeLocation(dt_utc=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+    frame = scalar_provider.get_sky_frame(tl)
 
     aspects = compute_aspects_for_frame(frame, bodies=["Sun", "Moon"], aspects={"conjunction": 0.0}, orb=30.0)
     # With generous orb, there should be at least one relation
@@ -20,20 +18,18 @@ def test_scalar_aspects_basic():
     assert isinstance(aspects["conjunction"], dict)
 
 
-def test_vector_aspects_shape_and_symmetry():
+def test_vector_aspects_shape_and_symmetry(vector_provider):
     # Same time points as ephemeris benchmark used conceptually
-    tz = pytz.utc
+    tz = timezone.utc
     times = [
         datetime(2000, 1, 1, 12, 0, 0, tzinfo=tz),
         datetime(2000, 1, 2, 12, 0, 0, tzinfo=tz),
         datetime(2000, 1, 3, 12, 0, 0, tzinfo=tz),
     ]
 
-    # Build a batch from the vector provider
-    provider_vec = get_default_provider(use_vector_engine=True)
-    from raavi_ephemeris import datetime_to_julian  # re-use helper
+    # Build a batch from the shared vector provider
     jds = np.array([datetime_to_julian(t) for t in times])
-    batch = provider_vec._backend.calculate_batch(jds)
+    batch = vector_provider._backend.calculate_batch(jds)
 
     masks = compute_aspects_for_batch(batch, bodies=["Sun", "Moon"], aspects={"conjunction": 0.0}, orb=30.0)
     assert "conjunction" in masks
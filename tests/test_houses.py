@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from conftest import cached_default_provider
+from raavi_ephemeris import TimeLocation
+
+SYSTEMS = "PKEW"
+
+
+@pytest.fixture(scope="module")
+def house_frames():
+    # One sky frame per house system, all for the same instant; the Sun
+    # calc inside each frame is shared via the provider cache config.
+    tl = TimeLocation(
+        dt_utc=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        latitude=35.6892,
+        longitude=51.3890,
+    )
+    return {
+        s: cached_default_provider(
+            calculate_houses=True, house_system=s, bodies=["Sun"]
+        )
+        .get_sky_frame(tl)
+        .houses
+        for s in SYSTEMS
+    }
+
+
+def test_asc_mc_agree_across_systems(house_frames):
+    # ASC and MC are system-independent angles.
+    asc = np.array([house_frames[s]["asc"] for s in SYSTEMS])
+    mc = np.array([house_frames[s]["mc"] for s in SYSTEMS])
+    np.testing.assert_allclose(asc, asc[0], atol=1e-6)
+    np.testing.assert_allclose(mc, mc[0], atol=1e-6)
+
+
+def test_middle_cusps_differ_between_systems(house_frames):
+    # Intermediate cusps are where the systems actually disagree; at a
+    # mid-latitude location Placidus and Equal must not coincide.
+    placidus = np.array(house_frames["P"]["cusps"])
+    equal = np.array(house_frames["E"]["cusps"])
+    assert np.abs(placidus[3] - equal[3]) > 1e-3
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from logic import maitri, strengths
@@ -28,6 +29,31 @@ def test_compound_maitri_basic_cases():
     assert comp["Sun"]["Mars"] == maitri.COMPOUND_ADHIMITRA
 
 
+def test_maitri_array_matches_dict_api():
+    # The SoA matrix entry points must agree with the dict API everywhere.
+    mapping = {"Sun": 0, "Mars": 2, "Jupiter": 4, "Venus": 7}
+    signs = maitri.signs_array(mapping)
+
+    temp_mat = maitri.compute_temporary_maitri_array(signs)
+    comp_mat = maitri.compute_compound_maitri_array(signs)
+    temp = maitri.compute_temporary_maitri(mapping)
+    comp = maitri.compute_compound_maitri(mapping)
+
+    sun, mars = maitri.PLANET_INDEX["Sun"], maitri.PLANET_INDEX["Mars"]
+    assert temp_mat[sun, mars] == maitri.RELATION_CODES[maitri.RELATION_FRIEND]
+
+    for p1, i in maitri.PLANET_INDEX.items():
+        for p2, j in maitri.PLANET_INDEX.items():
+            if p1 == p2 or p1 not in mapping or p2 not in mapping:
+                continue
+            assert temp_mat[i, j] == maitri.RELATION_CODES[temp[p1][p2]]
+            assert maitri.COMPOUND_BY_CODE[int(comp_mat[i, j])] == comp[p1][p2]
+
+    # Absent planets stay zeroed.
+    moon = maitri.PLANET_INDEX["Moon"]
+    assert not temp_mat[moon].any() and not comp_mat[:, moon].any()
+
+
 def test_vimsopaka_score_own_and_friend():
     # Sun in Leo (Own) -> 20
     # Moon in Leo (Friend Sun) – for scoring, relationship is via sign lord.
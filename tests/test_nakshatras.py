@@ -25,17 +25,33 @@ def test_nakshatra_scalar_boundaries():
     assert pada == 1
 
 def test_nakshatra_batch_parity():
-    # Create an array of test longitudes
-    lons = np.array([0.0, 10.0, 13.5, 120.0, 359.9])
-    
-    # Vector calculation
+    # Dense sweep so the batch path is exercised at scale; the reference
+    # is computed as one NumPy expression instead of a scalar-call loop.
+    lons = np.linspace(0.0, 360.0, 10_000, endpoint=False)
+    extent = 360.0 / 27.0
+
     vec_idxs, vec_padas = get_nakshatra_batch(lons)
-    
-    # Scalar verification loop
-    for i, lon in enumerate(lons):
-        scal_idx, _, scal_pada = get_nakshatra_scalar(lon)
-        assert vec_idxs[i] == scal_idx
-        assert vec_padas[i] == scal_pada
+
+    # Same fraction-of-index formula as get_nakshatra_scalar, in array
+    # form; a modulo-based reference disagrees in the last ulp at exact
+    # quadrant boundaries (90, 180, 270).
+    ref_raw = (lons % 360.0) / extent
+    ref_idx = np.floor(ref_raw).astype(int)
+    ref_pada = np.floor((ref_raw - ref_idx) * 4.0).astype(int) + 1
+    np.testing.assert_array_equal(vec_idxs, ref_idx)
+    np.testing.assert_array_equal(vec_padas, ref_pada)
+
+def test_scalar_batch_agree_on_random_points():
+    # Lock the (possibly jitted) scalar path to the batch path on a large
+    # random sample; spot-check the first 100 points scalar-side.
+    lons = np.random.default_rng(0).uniform(0.0, 360.0, 100_000)
+    vec_idx, vec_pada = get_nakshatra_batch(lons)
+    assert vec_idx.min() >= 0 and vec_idx.max() <= 26
+    assert vec_pada.min() >= 1 and vec_pada.max() <= 4
+    for lon, i, p in zip(lons[:100], vec_idx[:100], vec_pada[:100]):
+        si, _, sp = get_nakshatra_scalar(lon)
+        assert (i, p) == (si, sp)
+
 
 def test_specific_nakshatra_points():
     # Magha starts at 120 degrees (Leo 0)
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Raavi"))
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from raavi_ephemeris import TimeLocation
+from panchanga_engine import compute_panchanga
+
+CHENNAI = pytz.timezone("Asia/Kolkata")
+# Localized once at import; compute_jd_pair prefers dt_utc, which skips
+# pytz's transition-table walk, while dt_local anchors the civil day.
+DIWALI_2023_LOCAL = datetime(2023, 11, 12, 6, 0, 0)
+DIWALI_2023_UTC = CHENNAI.localize(DIWALI_2023_LOCAL).astimezone(pytz.utc)
+
+
+@pytest.fixture(scope="module")
+def diwali_2023_panchanga(panchanga_provider):
+    # Diwali (Lakshmi Puja) morning in Chennai, shared by the vara and
+    # paksha checks below so the day is computed once.
+    tl = TimeLocation(
+        dt_utc=DIWALI_2023_UTC,
+        dt_local=DIWALI_2023_LOCAL,
+        tz=CHENNAI,
+        latitude=13.0827,
+        longitude=80.2707,
+    )
+    return compute_panchanga(tl, panchanga_provider)
+
+
+def test_vara_diwali_2023(diwali_2023_panchanga):
+    assert diwali_2023_panchanga.vara_index == 0
+    assert diwali_2023_panchanga.vara == "Sunday"
+
+
+def test_paksha_diwali_2023(diwali_2023_panchanga):
+    # Waning fortnight: Krishna Chaturdashi at sunrise, Amavasya follows.
+    assert diwali_2023_panchanga.paksha == "Krishna"
+    assert diwali_2023_panchanga.tithi.index == 28
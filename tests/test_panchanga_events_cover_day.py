@@ -1,47 +1,27 @@
 import sys
 from pathlib import Path
-from datetime import datetime
 
-import pytest
-import pytz
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Raavi"))
 
-from raavi_ephemeris import TimeLocation, get_default_provider
-from panchanga_engine import compute_panchanga, PanchangaConfig
-
-
-TEHRAN = pytz.timezone("Asia/Tehran")
-
-
 def _assert_event_list_well_formed(events, start: float, end_limit: float):
     assert events, "event list must not be empty when compute_end_times=True"
-    prev = start
-    for ev in events:
-        assert start <= ev.end_jd_utc <= end_limit
-        assert ev.end_jd_utc >= prev
-        prev = ev.end_jd_utc
+    # One pass over a float64 array instead of a Python loop with a
+    # running prev; monotonicity and the bounds become three C-level checks.
+    ends = np.fromiter(
+        (ev.end_jd_utc for ev in events), dtype=np.float64, count=len(events)
+    )
+    assert ends[0] >= start and ends[-1] <= end_limit
+    assert np.all(np.diff(ends) >= 0)
+    return ends
 
 
-def test_panchanga_events_cover_day():
-    tl = TimeLocation(
-        dt_local=datetime(1997, 6, 7, 6, 0, 0),
-        tz=TEHRAN,
-        latitude=35.6892,
-        longitude=51.3890,
-    )
-    provider = get_default_provider(
-        use_vector_engine=False,
-        sidereal=True,
-        ayanamsa="LAHIRI",
-        calculate_houses=False,
-        bodies=["Sun", "Moon"],
-    )
-    config = PanchangaConfig(compute_end_times=True, samples_per_day=7)
-    result = compute_panchanga(tl, provider, config=config)
+def test_panchanga_events_cover_day(tehran_panchanga_1997):
+    result = tehran_panchanga_1997
 
     upper_limit = result.sunrise_jd_utc + 1.2  # Allow slightly more than 1 day to be safe, next sunrise is approx +1.0
-    
+
     # Verify primary end-times match first event
     if result.tithi.events:
         assert result.tithi.end_jd_utc == result.tithi.events[0].end_jd_utc
@@ -52,13 +32,10 @@ def test_panchanga_events_cover_day():
     # Karana events should cover the whole day chronologically
     k_events = result.karana.events
     assert len(k_events) >= 2 # At least 2 karanas per day usually
-    
-    # Check strict ordering
-    end_times = [ev.end_jd_utc for ev in k_events]
-    assert end_times == sorted(end_times), "Karana events must be sorted"
-    
-    # Check boundaries
-    assert end_times[0] >= result.sunrise_jd_utc
+
+    end_times = _assert_event_list_well_formed(
+        k_events, result.sunrise_jd_utc, upper_limit
+    )
     # The last event should align with next sunrise (approx)
     # The logic adds interval up to next_sunrise, so the last event end_jd should be next_sunrise
     # We can check if it is > sunset to ensure it covers the day
@@ -69,5 +46,7 @@ def test_panchanga_events_cover_day():
         # Events might be empty if no change occurs (rare for Nak/Yoga, possible for Tithi)
         # But if present, must be ordered
         if lst:
-            t_list = [e.end_jd_utc for e in lst]
-            assert t_list == sorted(t_list)
+            ends = np.fromiter(
+                (e.end_jd_utc for e in lst), dtype=np.float64, count=len(lst)
+            )
+            assert np.all(np.diff(ends) >= 0)
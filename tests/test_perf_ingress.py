@@ -0,0 +1,49 @@
+"""
+Coarse performance gate for the hottest vectorized path: a Moon-only
+minute-resolution month through calculate_batch plus the ingress scan.
+
+pytest-benchmark is not a dependency of this repo, so the gate is a
+plain perf_counter budget set well above (roughly 5x) the measured cost
+on a modest machine — it exists to catch order-of-magnitude regressions
+(e.g. the batch path silently degrading to per-frame objects), not to
+detect noise-level slowdowns.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from logic.transits import find_zodiac_ingresses
+from raavi_ephemeris_vector import VectorizedProvider
+
+# One month at minute resolution; long enough that a per-sample Python
+# regression is unmissable, short enough to keep the suite quick.
+N_MINUTES = 43200
+
+BATCH_BUDGET_S = 8.0
+SCAN_BUDGET_S = 0.5
+
+
+@pytest.mark.benchmark
+def test_minute_resolution_month_within_budget():
+    provider = VectorizedProvider(bodies=["Moon"])
+    jds = 2460310.5 + np.arange(N_MINUTES) / 1440.0
+
+    start = time.perf_counter()
+    batch = provider.calculate_batch(jds)
+    batch_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ingresses = find_zodiac_ingresses(batch, "Moon")
+    scan_elapsed = time.perf_counter() - start
+
+    # Sanity: the sweep actually produced the month's sign changes.
+    assert len(ingresses) >= 12
+
+    assert batch_elapsed < BATCH_BUDGET_S, (
+        f"calculate_batch took {batch_elapsed:.2f}s for {N_MINUTES} points"
+    )
+    assert scan_elapsed < SCAN_BUDGET_S, (
+        f"find_zodiac_ingresses took {scan_elapsed:.2f}s for {N_MINUTES} points"
+    )
@@ -1,7 +1,13 @@
+import functools
+
 import pytz
-from datetime import datetime
+from datetime import datetime, timezone
+
+from chart_calculator import ChartCalculator
+from logic.shadbala import ShadbalaComponents
 
-from raavi_ephemeris import TimeLocation, get_default_provider, SkyFrame, SkyPosition
+from conftest import cached_default_provider
+from raavi_ephemeris import TimeLocation, SkyFrame, SkyPosition
 from logic.shadbala import (
     calculate_uchcha_bala,
     calculate_dig_bala,
@@ -41,13 +47,11 @@ def test_naisargika_bala_static_values():
 
 
 def test_shadbala_integration_with_chart_calculator():
-    from chart_calculator import ChartCalculator
-
     tz = TEHRAN
     local_dt = tz.localize(datetime(2000, 1, 1, 12, 0))
-    utc_dt = local_dt.astimezone(pytz.utc)
+    utc_dt = local_dt.astimezone(timezone.utc)
 
-    provider = get_default_provider(
+    provider = cached_default_provider(
         calculate_houses=True,
         house_system="P",
         sidereal=True,
@@ -97,16 +101,23 @@ def test_sthana_bala_components_sun_exalted_kendra():
     assert sthana >= expected_min
 
 
+# Shared positions for the synthetic Kaala frames: only the hour varies
+# between cases, so the SkyPosition instances are module constants and
+# the frames are cached per hour.
+_SIMPLE_SUN = SkyPosition(body_id="Sun", jd=0.0, lon=0.0, lat=0.0, speed_lon=0.98)
+# Full Moon opposite the Sun for maximum Paksha contrast
+_SIMPLE_MOON = SkyPosition(body_id="Moon", jd=0.0, lon=180.0, lat=0.0, speed_lon=13.0)
+
+
+@functools.cache
 def _make_simple_frame_for_time(hour: int) -> SkyFrame:
     """
     Construct a minimal SkyFrame with Sun and Moon positions and a given UTC hour.
     Longitudes are arbitrary but consistent for Paksha computation.
+    The frames are read-only in these tests, so caching is safe.
     """
-    dt = datetime(2000, 1, 1, hour, 0, tzinfo=pytz.utc)
-    sun = SkyPosition(body_id="Sun", jd=0.0, lon=0.0, lat=0.0, speed_lon=0.98)
-    # Full Moon opposite the Sun for maximum Paksha contrast
-    moon = SkyPosition(body_id="Moon", jd=0.0, lon=180.0, lat=0.0, speed_lon=13.0)
-    positions = {"Sun": sun, "Moon": moon}
+    dt = datetime(2000, 1, 1, hour, 0, tzinfo=timezone.utc)
+    positions = {"Sun": _SIMPLE_SUN, "Moon": _SIMPLE_MOON}
     return SkyFrame(jd=2451544.5, positions=positions, utc_datetime=dt)
 
 
@@ -142,8 +153,6 @@ def test_drik_bala_benefic_aspect_increases_strength():
 
 def test_shadbala_summary_ishta_kashta():
     # Build a simple synthetic Shadbala map for Sun and Saturn
-    from logic.shadbala import ShadbalaComponents
-
     sun_comp = ShadbalaComponents(
         sthana=180.0,  # 3 rupas
         dig=60.0,
@@ -1,27 +1,29 @@
 import pytest
 import numpy as np
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
 
-from raavi_ephemeris import get_default_provider, datetime_to_julian
+from raavi_ephemeris import datetime_to_julian_array
 from logic.transits import find_zodiac_ingresses
 
 
-def test_moon_ingress_vectorized():
+def test_moon_ingress_vectorized(vector_provider):
     # Setup: 10 days of data starting Jan 1, 2024.
     # The Moon moves ~13 degrees/day, so it changes sign every ~2.25 days.
     # In 10 days, we expect roughly 4 sign changes.
-    start_date = datetime(2024, 1, 1, tzinfo=pytz.utc)
+    start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
     days = 10
     # Hourly resolution (24 * 10 = 240 points) ensures we catch the transition
-    jds = np.array([datetime_to_julian(start_date + timedelta(hours=i)) for i in range(days * 24)])
+    jds = datetime_to_julian_array(start_date, days * 24, timedelta(hours=1))
     
     # Use Vector Engine
-    provider = get_default_provider(use_vector_engine=True)
-    batch = provider._backend.calculate_batch(jds)
+    batch = vector_provider._backend.calculate_batch(jds)
     
-    # Find Ingresses for the Moon
-    ingresses = find_zodiac_ingresses(batch, "Moon")
+    # One batched scan over every body; pull out the Moon's events.
+    per_body = find_zodiac_ingresses(batch)
+    ingresses = per_body["Moon"]
+
+    # The single-name form must agree with the batched scan.
+    assert find_zodiac_ingresses(batch, "Moon") == ingresses
     
     print(f"\nFound {len(ingresses)} Moon ingresses in {days} days (Hourly resolution):")
     for jd, f, t in ingresses:
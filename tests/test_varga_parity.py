@@ -1,3 +1,7 @@
+import pytz
+from datetime import datetime
+
+from chart_calculator import ChartCalculator
 from logic.varga_engine import calculate_all_vargas
 
 
@@ -43,11 +47,6 @@ def test_d30_trimsamsa_piecewise():
 
 def test_chart_calculator_includes_vargas():
     # Integration smoke test: verify that ChartCalculator returns a 'vargas' block.
-    import pytz
-    from datetime import datetime
-
-    from chart_calculator import ChartCalculator
-
     tz = pytz.timezone("Asia/Tehran")
     local_dt = tz.localize(datetime(2025, 1, 1, 12, 0))
     utc_dt = local_dt.astimezone(pytz.utc)
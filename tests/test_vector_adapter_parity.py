@@ -1,19 +1,197 @@
+import numpy as np
 import pytest
 import pytz
-from datetime import datetime
-from raavi_ephemeris import TimeLocation, get_default_provider
+import swisseph as swe
+from datetime import datetime, timezone
+from conftest import ayanamsa_at, cached_default_provider
+from raavi_ephemeris import BASE_FLAGS, BODY_IDS, POSITION_DTYPE, TimeLocation
+from raavi_ephemeris_vector import VectorizedProvider
 
+TEHRAN = pytz.timezone("Asia/Tehran")
 TIME_LOCATIONS = [
-    TimeLocation(dt_utc=datetime(2000, 1, 1, 12, 0, 0, tzinfo=pytz.utc)),
-    TimeLocation(dt_local=datetime(2020, 6, 21, 15, 30, 0), tz=pytz.timezone('Asia/Tehran')),
+    TimeLocation(dt_utc=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)),
+    TimeLocation(dt_local=datetime(2020, 6, 21, 15, 30, 0), tz=TEHRAN),
 ]
+TIME_LOCATION_IDS = ["2000-utc", "2020-tehran"]
 BODIES = ['Sun', 'Moon']
 
-def test_parity():
-    for tl in TIME_LOCATIONS:
-        classic = get_default_provider(use_vector_engine=False).get_sky_frame(tl)
-        vector = get_default_provider(use_vector_engine=True).get_sky_frame(tl)
-        for b in BODIES:
-            diff = abs(classic.positions[b].lon - vector.positions[b].lon)
-            assert diff == pytest.approx(0.0, abs=1e-6), f"Mismatch for {b}"
+def _to_array(frame, bodies):
+    """(n, 2) lon/lat table for a frame; one comparison covers all bodies."""
+    return np.array([[frame.positions[b].lon, frame.positions[b].lat] for b in bodies])
+
+
+@pytest.fixture(scope="module")
+def parity_arrays(scalar_provider, vector_provider):
+    # Both sides computed once for every parametrized case below: the
+    # vector side services all timestamps with one batched call over a JD
+    # array instead of a get_sky_frame call per TimeLocation.
+    frames = [scalar_provider.get_sky_frame(tl) for tl in TIME_LOCATIONS]
+    jds = np.array([frame.jd for frame in frames])
+    batch = vector_provider._backend.calculate_batch(jds)
+
+    cols = [batch.index_of(b) for b in BODIES]
+    vector = np.stack([batch.lon[:, cols], batch.lat[:, cols]], axis=-1)
+    scalar = np.array([_to_array(f, BODIES) for f in frames])
+    return scalar, vector
+
+
+@pytest.mark.parametrize("i", range(len(TIME_LOCATIONS)), ids=TIME_LOCATION_IDS)
+def test_parity(parity_arrays, i):
+    scalar, vector = parity_arrays
+    np.testing.assert_allclose(scalar[i], vector[i], atol=1e-6)
+
+
+def test_batch_rahu_ketu():
+    # The node invariants hold pointwise, so assert them over a wide JD
+    # sweep straight on the batch SoA arrays instead of per-frame objects.
+    # Ketu is not in the default body list, so this needs its own provider.
+    provider = VectorizedProvider(bodies=["Sun", "Moon", "Rahu", "Ketu"])
+    jds = np.linspace(2451545.0, 2451645.0, 1000)
+    batch = provider.calculate_batch(jds)
+
+    rahu_lon = batch.lon[:, batch.index_of("Rahu")]
+    ketu_lon = batch.lon[:, batch.index_of("Ketu")]
+    np.testing.assert_allclose(ketu_lon, (rahu_lon + 180.0) % 360.0, atol=1e-6)
+
+    # Default ketu_lat_mode is "pyjhora": latitude carried over unchanged.
+    rahu_lat = batch.lat[:, batch.index_of("Rahu")]
+    ketu_lat = batch.lat[:, batch.index_of("Ketu")]
+    np.testing.assert_allclose(ketu_lat, rahu_lat, atol=1e-9)
+
+
+def _wrap180(x):
+    """Branchless fold of any angle difference into [-180, 180)."""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def test_ayanamsa_difference(scalar_provider):
+    # Tropical minus sidereal must equal the ayanamsa for every body;
+    # both bodies are checked in one folded array comparison instead of
+    # a modulo + Python branch per body.
+    tl = TIME_LOCATIONS[0]
+    trop_frame = scalar_provider.get_sky_frame(tl)
+    sid_frame = cached_default_provider(
+        use_vector_engine=False, sidereal=True, ayanamsa="LAHIRI"
+    ).get_sky_frame(tl)
+
+    ayanamsa = ayanamsa_at(trop_frame.jd)
+    trop = np.array([trop_frame.positions[b].lon for b in ("Sun", "Moon")])
+    sid = np.array([sid_frame.positions[b].lon for b in ("Sun", "Moon")])
+    np.testing.assert_allclose(_wrap180(trop - sid), ayanamsa, atol=0.1)
+
+
+def _swiss_reference_table(jd, bodies):
+    """(n, 6) float64 table straight from swe.calc_ut, one row per body."""
+    return np.array([swe.calc_ut(jd, BODY_IDS[b], BASE_FLAGS)[0] for b in bodies])
+
+
+def test_positions_vs_direct_swiss(scalar_provider):
+    # Every body checked against swisseph directly in one array
+    # comparison, instead of an assertion pair per body.
+    frame = scalar_provider.get_sky_frame(TIME_LOCATIONS[0])
+    bodies = [b for b in frame.positions if b in BODY_IDS]
+
+    ref = _swiss_reference_table(frame.jd, bodies)
+    ours = np.array([frame.positions[b].lon for b in bodies])
+    np.testing.assert_allclose(ours, ref[:, 0], atol=1e-6)
+
+
+def test_analytic_mean_node():
+    # The opt-in closed-form mean node must track Swiss to its documented
+    # ~0.005 deg over 1900-2100 and keep the node invariants (zero
+    # latitude, Ketu opposition), including the Ketu-only stand-in case.
+    jds = np.linspace(2415020.0, 2488070.0, 500)
+    swiss = VectorizedProvider(bodies=["Rahu"]).calculate_batch(jds)
+    analytic = VectorizedProvider(
+        bodies=["Rahu", "Ketu"], analytic_mean_node=True
+    ).calculate_batch(jds)
+
+    rahu = analytic.lon[:, analytic.index_of("Rahu")]
+    np.testing.assert_allclose(
+        _wrap180(rahu - swiss.lon[:, 0]), 0.0, atol=0.01
+    )
+    np.testing.assert_allclose(analytic.lat, 0.0, atol=1e-12)
+    np.testing.assert_allclose(
+        analytic.lon[:, analytic.index_of("Ketu")],
+        (rahu + 180.0) % 360.0,
+        atol=1e-9,
+    )
+
+    ketu_only = VectorizedProvider(
+        bodies=["Ketu"], analytic_mean_node=True
+    ).calculate_batch(jds)
+    np.testing.assert_allclose(
+        ketu_only.lon[:, 0], (rahu + 180.0) % 360.0, atol=1e-9
+    )
+
+
+def test_batch_parallel_matches_serial():
+    # Deliberately runs calculate_batch (which executes the Ketu synthesis
+    # kernel in this process) *before* the parallel call: with the fork
+    # start method that ordering hung the interpreter at exit once numba
+    # was installed, so the spawn-based pool must both reproduce the
+    # serial results and let the workers come up from a clean slate.
+    provider = VectorizedProvider(bodies=["Sun", "Moon", "Ketu"])
+    jds = np.linspace(2451545.0, 2451575.0, 64)
+
+    serial = provider.calculate_batch(jds)
+    parallel = provider.calculate_batch_parallel(jds, nproc=2, min_parallel=16)
+
+    assert parallel.bodies == serial.bodies
+    np.testing.assert_allclose(parallel.raw_results, serial.raw_results, atol=1e-9)
+
+
+def test_position_records_view(scalar_provider):
+    # The structured-record view must mirror the SoA columns exactly and
+    # give per-body rows without building SkyPosition objects.
+    arr = scalar_provider.calculate_positions_array(TIME_LOCATIONS[0].jd)
+    rec = arr.records
+    assert rec.dtype == POSITION_DTYPE
+    np.testing.assert_allclose(rec["lon"], arr.lon)
+    np.testing.assert_allclose(rec["speed_lon"], arr.speed)
+    assert arr.record_of("Sun")["lon"] == arr.lon_of("Sun")
+
+
+def test_scalar_ketu_only():
+    # A Ketu-only scalar request computes Rahu internally, synthesizes
+    # Ketu from it and drops the helper; return_internal keeps it.
+    provider = cached_default_provider(use_vector_engine=False, bodies=["Ketu"])
+    tl = TIME_LOCATIONS[0]
+
+    frame = provider.get_sky_frame(tl)
+    assert list(frame.positions) == ["Ketu"]
+
+    internal = provider.get_sky_frame(tl, return_internal=True)
+    assert "Rahu" in internal.positions
+    np.testing.assert_allclose(
+        frame.positions["Ketu"].lon,
+        (internal.positions["Rahu"].lon + 180.0) % 360.0,
+        atol=1e-9,
+    )
+
+
+@pytest.fixture(scope="module")
+def node_batches():
+    # One batch per ketu_lat_mode, computed once for every parametrized case.
+    jds = np.array([2460390.0])  # 2024-03-20 12:00 UTC
+    return {
+        mode: VectorizedProvider(
+            bodies=["Rahu", "Ketu"], ketu_lat_mode=mode
+        ).calculate_batch(jds)
+        for mode in ("pyjhora", "mirrored")
+    }
+
+
+@pytest.mark.parametrize("mode, lat_sign", [("pyjhora", 1.0), ("mirrored", -1.0)])
+def test_ketu_lat_modes(node_batches, mode, lat_sign):
+    batch = node_batches[mode]
+    rahu_lon = batch.lon[:, batch.index_of("Rahu")]
+    ketu_lon = batch.lon[:, batch.index_of("Ketu")]
+    # The opposition invariant holds regardless of latitude mode.
+    np.testing.assert_allclose(ketu_lon, (rahu_lon + 180.0) % 360.0, atol=1e-6)
+    np.testing.assert_allclose(
+        batch.lat[:, batch.index_of("Ketu")],
+        lat_sign * batch.lat[:, batch.index_of("Rahu")],
+        atol=1e-9,
+    )
 